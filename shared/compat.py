@@ -0,0 +1,19 @@
+"""Compatibility helpers for supported Python versions."""
+
+import sys
+from datetime import datetime
+from typing import Any, Dict
+
+# Keyword arguments enabling __slots__ on dataclasses where supported (3.10+).
+# Slotted instances drop the per-instance __dict__, which adds up for objects
+# kept in large in-memory histories.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts a trailing "Z" natively, skipping the string copy
+    parse_iso_datetime = datetime.fromisoformat
+else:  # pragma: no cover - Python < 3.11
+
+    def parse_iso_datetime(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, including a trailing "Z"."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -0,0 +1,133 @@
+"""Fast JSON serialization helpers (orjson when available, stdlib json otherwise)."""
+
+import dataclasses
+import json
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the "fast" extra
+    orjson = None  # type: ignore[assignment]
+
+# Write buffer for record exports; batches many small writes into few syscalls
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+@lru_cache(maxsize=2048)
+def _cached_isoformat(value: date) -> str:
+    """Format a naive datetime or a date, reusing the string for repeated timestamps."""
+    return value.isoformat()
+
+
+def _isoformat(value: date) -> str:
+    """Format a date/datetime, caching values whose string depends on equality alone."""
+    # Aware datetimes for the same instant compare equal across UTC offsets,
+    # so a cached string could carry another value's offset
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.isoformat()
+    return _cached_isoformat(value)
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types that neither backend handles natively."""
+    if isinstance(obj, (bytes, bytearray)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, (datetime, date)):
+        return _isoformat(obj)
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[str, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: JSON text or UTF-8 encoded bytes
+
+    Returns:
+        Parsed data
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON.
+
+    Dataclasses and datetimes are serialized directly, so callers don't need
+    to build intermediate dicts.
+
+    Args:
+        data: Data to serialize
+        indent: Pretty-print with 2-space indentation
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        # Non-string keys (e.g. integer YAML keys) are stringified like stdlib json does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            return orjson.dumps(data, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits; stdlib json writes them as-is
+            pass
+
+    return json.dumps(
+        data,
+        default=_default,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def dump_records(
+    filepath: Path,
+    records: Iterable[Any],
+    envelope: Dict[str, Any],
+    key: str = "requests",
+) -> None:
+    """
+    Stream records to a JSON file without building the whole document.
+
+    Writes ``{**envelope, key: [record, ...]}`` with one record per line, so
+    only a single serialized record is held in memory at a time. A ``.jsonl``
+    path writes bare JSON Lines and ignores the envelope.
+
+    Args:
+        filepath: Output file path
+        records: Records to serialize (dicts, dataclasses, ...)
+        envelope: Top-level fields written before the records
+        key: Name of the records array
+    """
+    with open(filepath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        if Path(filepath).suffix == ".jsonl":
+            for record in records:
+                f.write(dumps(record))
+                f.write(b"\n")
+            return
+
+        head = dumps(envelope)[:-1]  # drop the closing brace
+        f.write(head)
+        if envelope:
+            f.write(b",")
+        f.write(dumps(key))
+        f.write(b":[")
+
+        separator = b"\n"
+        for record in records:
+            f.write(separator)
+            f.write(dumps(record))
+            separator = b",\n"
+
+        f.write(b"\n]}\n")
@@ -0,0 +1,16 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+import shared.serialization
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Run a test with orjson and with the stdlib json fallback."""
+    if request.param == "orjson":
+        if shared.serialization.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(shared.serialization, "orjson", None)
+    return request.param
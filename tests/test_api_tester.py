@@ -0,0 +1,156 @@
+"""Tests for API Tester."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tools.api_tester import APIRequest, APITester, HTTPMethod
+from tools.api_tester.tester import _method_name
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    """Answer with the request method and path as JSON."""
+    return httpx.Response(
+        200,
+        json={"method": request.method, "path": request.url.path},
+        headers={"X-Request-Id": "abc"},
+    )
+
+
+def mock_tester(handler) -> APITester:
+    """Build an APITester whose HTTP clients are served by `handler`."""
+    tester = APITester()
+    tester._client.close()
+    tester._client = httpx.Client(transport=httpx.MockTransport(handler))
+    tester._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return tester
+
+
+class TestRequest:
+    """Test single requests through the pooled client."""
+
+    def test_json_response(self):
+        """Test that JSON bodies are parsed and headers and timing are kept."""
+        with mock_tester(echo) as tester:
+            response = tester.get("https://api.test/users")
+
+        assert response.status_code == 200
+        assert response.method == "GET"
+        assert response.body == {"method": "GET", "path": "/users"}
+        assert response.headers["x-request-id"] == "abc"
+        assert response.elapsed_ms >= 0
+        assert response.error is None
+        assert list(tester.history) == [response]
+
+    def test_text_response(self):
+        """Test that non-JSON bodies are kept as text."""
+        tester = mock_tester(lambda request: httpx.Response(200, text="plain"))
+
+        assert tester.post("https://api.test/").body == "plain"
+
+    def test_invalid_json_falls_back_to_text(self):
+        """Test that a JSON content type with a broken body keeps the text."""
+        tester = mock_tester(
+            lambda request: httpx.Response(
+                200, content=b"{oops", headers={"Content-Type": "application/json"}
+            )
+        )
+
+        assert tester.get("https://api.test/").body == "{oops"
+
+    def test_connection_error_is_captured(self):
+        """Test that transport errors become an APIResponse instead of raising."""
+
+        def fail(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        response = mock_tester(fail).get("https://api.test/")
+
+        assert response.status_code == 0
+        assert response.body is None
+        assert "connection refused" in response.error
+
+    def test_get_history(self):
+        """Test newest-first history and limit handling."""
+        tester = mock_tester(echo)
+        for path in ("/a", "/b", "/c"):
+            tester.get(f"https://api.test{path}")
+
+        assert [r.body["path"] for r in tester.get_history(limit=2)] == ["/c", "/b"]
+        assert len(tester.get_history()) == 3
+        assert len(tester.get_history(limit=-1)) == 3
+
+    def test_method_name(self):
+        """Test that enum members and plain strings give upper-case names."""
+        assert _method_name(HTTPMethod.PATCH) == "PATCH"
+        assert _method_name("delete") == "DELETE"
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_history(self, tmp_path):
+        """Test that stored responses, headers included, can be exported."""
+        tester = mock_tester(echo)
+        tester.get("https://api.test/a")
+
+        filepath = tmp_path / "history.json"
+        tester.save_history(filepath)
+
+        data = json.loads(filepath.read_text(encoding="utf-8"))
+        assert data["total"] == 1
+        assert data["requests"][0]["headers"]["x-request-id"] == "abc"
+
+
+class TestRunMany:
+    """Test concurrent batched requests."""
+
+    def test_results_keep_request_order(self):
+        """Test that responses line up with their requests."""
+        tester = mock_tester(echo)
+        requests = [APIRequest("GET", f"https://api.test/{i}") for i in range(5)]
+
+        responses = tester.run_many(requests)
+
+        assert [r.body["path"] for r in responses] == [f"/{i}" for i in range(5)]
+        assert tester._async_client is None
+
+    def test_concurrency_limit(self):
+        """Test that no more than `concurrency` requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def slow(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(204)
+
+        tester = mock_tester(slow)
+        requests = [APIRequest(HTTPMethod.GET, "https://api.test/") for _ in range(10)]
+
+        responses = tester.run_many(requests, concurrency=3)
+
+        assert [r.status_code for r in responses] == [204] * 10
+        assert peak == 3
+
+    def test_errors_are_captured(self):
+        """Test that error statuses and failed requests don't abort the batch."""
+
+        def handler(request):
+            if request.url.path == "/down":
+                raise httpx.ConnectError("connection refused", request=request)
+            if request.url.path == "/missing":
+                return httpx.Response(404, json={"error": "not found"})
+            return echo(request)
+
+        tester = mock_tester(handler)
+        paths = ["/ok", "/missing", "/down"]
+
+        responses = tester.run_many([APIRequest("GET", f"https://api.test{p}") for p in paths])
+
+        assert [r.status_code for r in responses] == [200, 404, 0]
+        assert responses[1].body == {"error": "not found"}
+        assert "connection refused" in responses[2].error
+        assert len(tester.history) == 3
@@ -0,0 +1,290 @@
+"""Tests for CSV to SQL Converter."""
+
+import io
+
+import pytest
+
+from tools.csv_to_sql.converter import ColumnType, CSVToSQL, DataFormat, SQLDialect
+from tools.csv_to_sql.schema_cache import SchemaCache
+
+
+@pytest.fixture
+def users_csv(tmp_path):
+    """Small CSV file with mixed column types."""
+    filepath = tmp_path / "users.csv"
+    filepath.write_text(
+        "id,name,score,active,joined\n"
+        "1,Alice,1.50,true,2024-01-02\n"
+        "2,Bob's,2.25,false,2024-02-03\n"
+        "3,Carol,,yes,2024-03-04\n",
+        encoding="utf-8",
+    )
+    return filepath
+
+
+class TestConvert:
+    """Test SQL generation."""
+
+    def test_convert_returns_full_script(self, users_csv):
+        """Test that convert returns CREATE TABLE followed by INSERTs."""
+        sql = CSVToSQL().convert(users_csv, "users", batch_size=2)
+
+        assert sql.startswith("CREATE TABLE users (")
+        assert sql.count("INSERT INTO users (id, name, score, active, joined) VALUES") == 2
+        assert "(2, 'Bob''s', 2.25, FALSE, '2024-02-03')" in sql
+        assert "(3, 'Carol', NULL, TRUE, '2024-03-04');" in sql
+
+    def test_convert_writes_output_file(self, users_csv, tmp_path):
+        """Test that convert streams the SQL to the output file."""
+        output = tmp_path / "users.sql"
+        result = CSVToSQL().convert(users_csv, "users", output_path=output)
+
+        assert result == ""
+        assert output.read_text(encoding="utf-8") == CSVToSQL().convert(users_csv, "users")
+
+    def test_convert_stream_matches_convert(self, users_csv):
+        """Test that streaming output is identical to the in-memory result."""
+        converter = CSVToSQL(dialect=SQLDialect.MYSQL)
+        sink = io.StringIO()
+
+        count = converter.convert_stream(users_csv, "users", sink, batch_size=1)
+
+        assert count == 3
+        assert sink.getvalue() == converter.convert(users_csv, "users", batch_size=1)
+
+    def test_schema_only(self, users_csv):
+        """Test that schema-only output has no INSERTs."""
+        sql = CSVToSQL().convert(users_csv, "users", schema_only=True)
+
+        assert "CREATE TABLE users" in sql
+        assert "INSERT" not in sql
+
+    def test_iter_insert_statements_is_lazy(self, users_csv):
+        """Test that INSERT batches are produced one at a time."""
+        converter = CSVToSQL()
+        columns = converter.infer_schema(users_csv)
+
+        statements = converter.iter_insert_statements(users_csv, "users", columns, batch_size=1)
+
+        assert next(statements).endswith("(1, 'Alice', 1.50, TRUE, '2024-01-02');")
+        assert len(list(statements)) == 2
+
+    def test_value_formatting_per_dialect(self, tmp_path):
+        """Test NULLs, booleans and quoting in generated INSERTs."""
+        filepath = tmp_path / "flags.csv"
+        filepath.write_text("n,flag,label\n1,yes,it's\n ,no, \n", encoding="utf-8")
+
+        pg_sql = CSVToSQL().convert(filepath, "flags")
+        mysql_sql = CSVToSQL(dialect=SQLDialect.MYSQL).convert(filepath, "flags")
+
+        assert "(1, TRUE, 'it''s'),\n(NULL, FALSE, NULL);" in pg_sql
+        assert "(1, 1, 'it''s'),\n(NULL, 0, NULL);" in mysql_sql
+
+    def test_boolean_spellings(self, tmp_path):
+        """Test that true is recognized in any letter case."""
+        filepath = tmp_path / "flags.csv"
+        filepath.write_text("flag\nTrue\nyEs\n1\nFALSE\nno\n", encoding="utf-8")
+
+        sql = CSVToSQL(dialect=SQLDialect.SQLITE).convert(filepath, "flags")
+
+        assert "(1),\n(1),\n(1),\n(0),\n(0);" in sql
+
+    def test_copy_format(self, tmp_path):
+        """Test PostgreSQL COPY output with escaping and NULLs."""
+        filepath = tmp_path / "notes.csv"
+        filepath.write_text('id,ok,note\n1,yes,"a\tb\\c"\n2,no,\n3\n', encoding="utf-8")
+        sink = io.StringIO()
+
+        count = CSVToSQL().convert_stream(filepath, "notes", sink, data_format=DataFormat.COPY)
+
+        assert count == 1
+        assert sink.getvalue().endswith(
+            "COPY notes (id, ok, note) FROM STDIN;\n"
+            "1\tt\ta\\tb\\\\c\n"
+            "2\tf\t\\N\n"
+            "3\t\\N\t\\N\n"
+            "\\.\n"
+        )
+
+    def test_copy_format_requires_postgresql(self, users_csv):
+        """Test that COPY output is rejected for other dialects."""
+        converter = CSVToSQL(dialect=SQLDialect.MYSQL)
+
+        with pytest.raises(ValueError, match="PostgreSQL"):
+            converter.convert_stream(users_csv, "users", io.StringIO(), data_format=DataFormat.COPY)
+
+    def test_convert_stream_emits_rows_beyond_sample(self, users_csv):
+        """Test that sampled rows and the rest of the file are all inserted."""
+        sink = io.StringIO()
+
+        count = CSVToSQL().convert_stream(users_csv, "users", sink, batch_size=1, sample_size=1)
+
+        sql = sink.getvalue()
+        assert count == 3
+        assert "(1, 'Alice'" in sql
+        assert "(2, 'Bob''s'" in sql
+        assert "(3, 'Carol'" in sql
+
+    def test_convert_stream_without_header(self, tmp_path):
+        """Test that the first row is data when the CSV has no header."""
+        filepath = tmp_path / "plain.csv"
+        filepath.write_text("1,a\n2,b\n", encoding="utf-8")
+        sink = io.StringIO()
+
+        count = CSVToSQL().convert_stream(filepath, "plain", sink, has_header=False)
+
+        assert count == 1
+        expected = "INSERT INTO plain (column_0, column_1) VALUES\n(1, 'a'),\n(2, 'b');"
+        assert expected in sink.getvalue()
+
+
+class TestInferSchema:
+    """Test schema inference."""
+
+    def test_infer_types(self, users_csv):
+        """Test detected column types and nullability."""
+        columns = CSVToSQL().infer_schema(users_csv)
+        types = {col.name: col.type for col in columns}
+
+        assert types == {
+            "id": ColumnType.INTEGER,
+            "name": ColumnType.VARCHAR,
+            "score": ColumnType.DECIMAL,
+            "active": ColumnType.BOOLEAN,
+            "joined": ColumnType.DATE,
+        }
+        assert next(col for col in columns if col.name == "score").nullable
+        assert not next(col for col in columns if col.name == "id").nullable
+
+    def test_numeric_detection_rejects_python_only_literals(self):
+        """Test that Python-only numeric literals are not treated as SQL numbers."""
+        converter = CSVToSQL()
+
+        assert converter._infer_column_type(["1_000", "2"])[0] == ColumnType.VARCHAR
+        assert converter._infer_column_type(["nan.", "1.5"])[0] == ColumnType.VARCHAR
+        assert converter._infer_column_type(["-12", "+7"])[0] == ColumnType.INTEGER
+        assert converter._infer_column_type(["1.5e3", ".25"])[0] == ColumnType.DECIMAL
+
+    def test_mixed_integer_and_decimal_widens_to_decimal(self):
+        """Test that one fractional value makes an integer column DECIMAL."""
+        converter = CSVToSQL()
+
+        assert converter._infer_column_type(["1", "2", "3.5"])[0] == ColumnType.DECIMAL
+        assert converter._infer_column_type(["1", "x", "3.5"])[0] == ColumnType.VARCHAR
+
+    def test_date_and_datetime_detection(self):
+        """Test the supported date and datetime formats."""
+        converter = CSVToSQL()
+
+        assert converter._infer_column_type(["2024-01-02", "31/12/2023"])[0] == ColumnType.DATE
+        assert converter._infer_column_type(["2024-01-02 10:00:00"])[0] == ColumnType.DATETIME
+        assert converter._infer_column_type(["2024-01-02T10:00:00Z"])[0] == ColumnType.DATETIME
+        assert converter._infer_column_type(["2024-01-02x"])[0] == ColumnType.VARCHAR
+
+    def test_sanitize_name(self):
+        """Test identifier sanitizing."""
+        converter = CSVToSQL()
+
+        assert converter._sanitize_name("First  Name!") == "first_name"
+        assert converter._sanitize_name("2nd col") == "col_2nd_col"
+        assert converter._sanitize_name("!!!") == "column"
+
+    def test_first_data_row_is_sampled(self, tmp_path):
+        """Test that the row right after the header takes part in inference."""
+        filepath = tmp_path / "codes.csv"
+        filepath.write_text("code\nA1\n2\n3\n", encoding="utf-8")
+
+        columns = CSVToSQL().infer_schema(filepath)
+
+        assert columns[0].type == ColumnType.VARCHAR
+
+    def test_ragged_rows(self, tmp_path):
+        """Test that short rows count as NULL and extra cells are ignored."""
+        filepath = tmp_path / "ragged.csv"
+        filepath.write_text("a,b\n1,2,3\n4\n", encoding="utf-8")
+
+        columns = CSVToSQL().infer_schema(filepath)
+
+        assert [col.name for col in columns] == ["a", "b"]
+        assert [col.type for col in columns] == [ColumnType.INTEGER, ColumnType.INTEGER]
+        assert [col.nullable for col in columns] == [False, True]
+
+    def test_header_only(self, tmp_path):
+        """Test that a file without data rows still yields its columns."""
+        filepath = tmp_path / "empty.csv"
+        filepath.write_text("a,b\n", encoding="utf-8")
+
+        columns = CSVToSQL().infer_schema(filepath)
+
+        assert [(col.name, col.type) for col in columns] == [
+            ("a", ColumnType.VARCHAR),
+            ("b", ColumnType.VARCHAR),
+        ]
+
+
+class TestSchemaCache:
+    """Test the on-disk schema cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Schema cache in a temporary directory."""
+        cache = SchemaCache(tmp_path / "cache" / "schemas.sqlite")
+        yield cache
+        cache.close()
+
+    def test_second_inference_uses_cache(self, users_csv, cache, monkeypatch):
+        """Test that a cached schema is returned without re-inferring."""
+        converter = CSVToSQL(schema_cache=cache)
+        columns = converter.infer_schema(users_csv)
+
+        def fail(*args):
+            raise AssertionError("schema was inferred again")
+
+        monkeypatch.setattr(converter, "_build_columns", fail)
+
+        assert converter.infer_schema(users_csv) == columns
+        assert converter.convert(users_csv, "users") == CSVToSQL().convert(users_csv, "users")
+
+    def test_changed_file_is_reinferred(self, users_csv, cache):
+        """Test that editing the file invalidates its cached schema."""
+        converter = CSVToSQL(schema_cache=cache)
+        converter.infer_schema(users_csv)
+
+        users_csv.write_text("id,name\nx,Alice\n", encoding="utf-8")
+
+        assert converter.infer_schema(users_csv)[0].type == ColumnType.VARCHAR
+
+    def test_key_depends_on_engine(self, users_csv):
+        """Test that schemas from different inference engines are cached apart."""
+        python_key = SchemaCache.make_key(users_csv, 1000, True)
+
+        assert python_key != SchemaCache.make_key(users_csv, 1000, True, engine="arrow")
+
+    def test_unusable_cache_is_ignored(self, users_csv, tmp_path):
+        """Test that cache errors fall back to inference."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        converter = CSVToSQL(schema_cache=SchemaCache(blocker / "schemas.sqlite"))
+
+        assert len(converter.infer_schema(users_csv)) == 5
+
+
+class TestArrowInference:
+    """Test the optional pyarrow inference path."""
+
+    def test_matches_builtin_inference(self, users_csv):
+        """Test that Arrow inference agrees with the built-in inference."""
+        pytest.importorskip("pyarrow")
+
+        columns = CSVToSQL(use_arrow=True).infer_schema(users_csv)
+
+        assert columns == CSVToSQL().infer_schema(users_csv)
+
+    def test_falls_back_without_pyarrow(self, users_csv, monkeypatch):
+        """Test that use_arrow is ignored when pyarrow is missing."""
+        monkeypatch.setattr("tools.csv_to_sql.converter.pa_csv", None)
+
+        converter = CSVToSQL(use_arrow=True)
+
+        assert not converter.use_arrow
+        assert len(converter.infer_schema(users_csv)) == 5
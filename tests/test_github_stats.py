@@ -0,0 +1,404 @@
+"""Tests for GitHub Stats Fetcher."""
+
+import asyncio
+import json
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from tools.github_stats.cache import ResponseCache
+from tools.github_stats.fetcher import GitHubStats
+
+REPO_PAYLOAD = {
+    "name": "demo",
+    "full_name": "octo/demo",
+    "owner": {"login": "octo"},
+    "description": "Demo repository",
+    "stargazers_count": 120,
+    "forks_count": 7,
+    "watchers_count": 120,
+    "open_issues_count": 3,
+    "language": "Python",
+    "created_at": "2020-01-01T00:00:00Z",
+    "updated_at": "2024-01-01T00:00:00Z",
+    "pushed_at": "2024-01-02T00:00:00Z",
+    "size": 2048,
+    "license": {"name": "MIT License"},
+    "topics": ["cli"],
+    "fork": False,
+    "archived": False,
+    "default_branch": "main",
+}
+
+
+def mock_fetcher(handler, use_graphql: bool = False) -> GitHubStats:
+    """Build a GitHubStats whose HTTP client is served by `handler`."""
+    fetcher = GitHubStats(token="test-token", use_graphql=use_graphql)
+    fetcher._client.close()
+    fetcher._client = httpx.Client(
+        base_url=fetcher.base_url,
+        headers=fetcher.headers,
+        transport=httpx.MockTransport(handler),
+    )
+    return fetcher
+
+
+class TestGitHubStats:
+    """Test REST fetching."""
+
+    def test_get_repo_stats(self):
+        """Test parsing repository stats."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, json=REPO_PAYLOAD))
+
+        stats = fetcher.get_repo_stats("octo/demo")
+
+        assert stats.error is None
+        assert stats.full_name == "octo/demo"
+        assert stats.stars == 120
+        assert stats.license == "MIT License"
+        assert stats.stars_per_day is not None
+
+    def test_get_repo_stats_not_found(self):
+        """Test that a 404 becomes an error result."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(404))
+
+        assert fetcher.get_repo_stats("octo/missing").error == "Repository not found"
+
+    def test_invalid_repo_format(self):
+        """Test that a repo without an owner is rejected without a request."""
+        fetcher = mock_fetcher(lambda request: pytest.fail("unexpected request"))
+
+        assert "Invalid repo format" in fetcher.get_repo_stats("demo").error
+
+    def test_client_is_reused(self):
+        """Test that all calls go through one pooled client with auth headers."""
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["authorization"])
+            if request.url.path.endswith("/languages"):
+                return httpx.Response(200, json={"Python": 10})
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        with mock_fetcher(handler) as fetcher:
+            client = fetcher._client
+            fetcher.get_repo_stats("octo/demo")
+            assert fetcher.get_languages("octo/demo") == {"Python": 10}
+            assert fetcher._client is client
+
+        assert seen == ["token test-token", "token test-token"]
+        assert client.is_closed
+
+    def test_compare_repos_concurrently(self):
+        """Test that compare_repos overlaps requests and keeps input order."""
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            name = request.url.path.rsplit("/", 1)[-1]
+            if name == "missing":
+                return httpx.Response(404)
+            return httpx.Response(200, json={**REPO_PAYLOAD, "full_name": f"octo/{name}"})
+
+        fetcher = mock_fetcher(handler)
+        fetcher._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = fetcher.compare_repos(["octo/a", "octo/missing", "octo/c", "bad"], concurrency=2)
+
+        assert [r.full_name for r in results] == ["octo/a", "octo/missing", "octo/c", "bad"]
+        assert [r.error is None for r in results] == [True, False, True, False]
+        assert peak == 2
+        assert fetcher._async_client is None
+
+    def test_contributor_count_from_link_header(self):
+        """Test that the count comes from the last page of a one-per-page listing."""
+        link = (
+            '<https://api.github.com/repositories/1/contributors?per_page=1&page=2>; rel="next", '
+            '<https://api.github.com/repositories/1/contributors?per_page=1&page=437>; rel="last"'
+        )
+
+        def handler(request):
+            assert request.url.params["per_page"] == "1"
+            return httpx.Response(200, json=[{"login": "a"}], headers={"Link": link})
+
+        assert mock_fetcher(handler).get_contributor_count("octo/demo") == 437
+
+    def test_contributor_count_single_page(self):
+        """Test counting without a Link header."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, json=[{"login": "a"}]))
+
+        assert fetcher.get_contributor_count("octo/demo") == 1
+
+    def test_contributors_follow_next_link(self):
+        """Test that listings page through rel="next" and stop at the limit."""
+        pages = {
+            "1": ([{"login": "a", "contributions": 3, "avatar_url": ""}] * 100, "2"),
+            "2": ([{"login": "b", "contributions": 1, "avatar_url": ""}] * 100, "3"),
+        }
+        requested = []
+
+        def handler(request):
+            page = request.url.params.get("page", "1")
+            requested.append(page)
+            items, next_page = pages[page]
+            next_url = (
+                f"https://api.github.com/repositories/1/contributors?per_page=100&page={next_page}"
+            )
+            return httpx.Response(200, json=items, headers={"Link": f'<{next_url}>; rel="next"'})
+
+        contributors = mock_fetcher(handler).get_contributors("octo/demo", limit=150)
+
+        assert len(contributors) == 150
+        assert contributors[99].username == "a"
+        assert contributors[100].username == "b"
+        assert requested == ["1", "2"]
+
+    def test_search_repos_reads_items(self):
+        """Test that search results are taken from the items key."""
+
+        def handler(request):
+            assert request.url.params["per_page"] == "5"
+            return httpx.Response(200, json={"total_count": 1, "items": [REPO_PAYLOAD]})
+
+        results = mock_fetcher(handler).search_repos("demo", limit=5)
+
+        assert [r.full_name for r in results] == ["octo/demo"]
+
+    def test_search_repos_enriched(self):
+        """Test that languages and contributors are attached to every result."""
+        second = {**REPO_PAYLOAD, "full_name": "octo/other"}
+
+        def handler(request):
+            path = request.url.path
+            if path == "/search/repositories":
+                return httpx.Response(200, json={"items": [REPO_PAYLOAD, second]})
+            if path.endswith("/languages"):
+                return httpx.Response(200, json={"Python": len(path)})
+            contributor = {"login": path.split("/")[3], "contributions": 1, "avatar_url": ""}
+            return httpx.Response(200, json=[contributor] * 5)
+
+        fetcher = mock_fetcher(handler)
+        fetcher._async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        results = fetcher.search_repos_enriched("demo", contributors_limit=3)
+
+        assert [r.languages for r in results] == [
+            {"Python": len("/repos/octo/demo/languages")},
+            {"Python": len("/repos/octo/other/languages")},
+        ]
+        assert [[c.username for c in r.contributors] for r in results] == [
+            ["demo"] * 3,
+            ["other"] * 3,
+        ]
+        assert fetcher._async_client is None
+
+
+class TestRateLimit:
+    """Test retrying rate-limited requests."""
+
+    @pytest.fixture
+    def sleeps(self, monkeypatch):
+        """Record backoff delays instead of sleeping."""
+        sleeps = []
+        monkeypatch.setattr("tools.github_stats.fetcher.time.sleep", sleeps.append)
+        return sleeps
+
+    def test_retry_after_is_honored(self, sleeps):
+        """Test that a 429 is retried after the Retry-After delay."""
+        responses = [
+            httpx.Response(429, headers={"Retry-After": "7"}),
+            httpx.Response(200, json=REPO_PAYLOAD),
+        ]
+        fetcher = mock_fetcher(lambda request: responses.pop(0))
+
+        assert fetcher.get_repo_stats("octo/demo").error is None
+        assert sleeps == [7.0]
+
+    def test_retry_after_http_date(self, sleeps):
+        """Test that a Retry-After HTTP-date is turned into a delay."""
+        retry_at = formatdate(time.time() + 10, usegmt=True)
+        responses = [
+            httpx.Response(429, headers={"Retry-After": retry_at}),
+            httpx.Response(200, json=REPO_PAYLOAD),
+        ]
+        fetcher = mock_fetcher(lambda request: responses.pop(0))
+
+        assert fetcher.get_repo_stats("octo/demo").error is None
+        assert 8 < sleeps[0] <= 10
+
+    @pytest.mark.parametrize(
+        "headers",
+        [
+            {"Retry-After": "soon"},
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "later"},
+        ],
+    )
+    def test_malformed_wait_headers_use_backoff(self, sleeps, headers):
+        """Test that unparsable wait headers fall back to the backoff delay."""
+        responses = [httpx.Response(429, headers=headers), httpx.Response(200, json=REPO_PAYLOAD)]
+        fetcher = mock_fetcher(lambda request: responses.pop(0))
+
+        assert fetcher.get_repo_stats("octo/demo").error is None
+        assert len(sleeps) == 1 and 1 <= sleeps[0] <= 2
+
+    def test_backoff_grows_until_retries_run_out(self, sleeps):
+        """Test exponential backoff and the error result after the last retry."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(403, headers={"X-RateLimit-Remaining": "0"})
+
+        fetcher = mock_fetcher(handler)
+        fetcher.max_retries = 3
+
+        assert fetcher.get_repo_stats("octo/demo").error == "Rate limit exceeded"
+        assert len(calls) == 4
+        assert [int(delay) for delay in sleeps] == [1, 2, 4]
+
+    def test_long_reset_fails_fast(self, sleeps):
+        """Test that a reset far in the future is not waited for."""
+        reset = str(int(time.time()) + 3600)
+        fetcher = mock_fetcher(
+            lambda request: httpx.Response(
+                403, headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}
+            )
+        )
+
+        assert fetcher.get_repo_stats("octo/demo").error == "Rate limit exceeded"
+        assert sleeps == []
+
+    def test_forbidden_is_not_retried(self, sleeps):
+        """Test that a 403 without rate limit headers is returned as is."""
+        fetcher = mock_fetcher(lambda request: httpx.Response(403))
+
+        assert "forbidden" in fetcher.get_repo_stats("octo/demo").error
+        assert sleeps == []
+
+
+GRAPHQL_REPOSITORY = {
+    "name": "demo",
+    "nameWithOwner": "octo/demo",
+    "owner": {"login": "octo"},
+    "description": "Demo repository",
+    "stargazerCount": 120,
+    "forkCount": 7,
+    "issues": {"totalCount": 2},
+    "pullRequests": {"totalCount": 1},
+    "primaryLanguage": {"name": "Python"},
+    "licenseInfo": {"name": "MIT License"},
+    "repositoryTopics": {"nodes": [{"topic": {"name": "cli"}}]},
+    "createdAt": "2020-01-01T00:00:00Z",
+    "updatedAt": "2024-01-01T00:00:00Z",
+    "pushedAt": "2024-01-02T00:00:00Z",
+    "diskUsage": 2048,
+    "isFork": False,
+    "isArchived": False,
+    "defaultBranchRef": {"name": "main"},
+}
+
+
+class TestGraphQL:
+    """Test GraphQL fetching."""
+
+    def test_graphql_matches_rest(self):
+        """Test that one GraphQL query yields the same stats as REST."""
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            if request.url.path == "/graphql":
+                return httpx.Response(200, json={"data": {"repository": GRAPHQL_REPOSITORY}})
+            return httpx.Response(200, json=REPO_PAYLOAD)
+
+        graphql = mock_fetcher(handler, use_graphql=True).get_repo_stats("octo/demo")
+        rest = mock_fetcher(handler).get_repo_stats("octo/demo")
+
+        assert requests[0].method == "POST"
+        assert json.loads(requests[0].content)["variables"] == {"owner": "octo", "name": "demo"}
+        assert graphql == rest
+
+    def test_graphql_not_found(self):
+        """Test that a NOT_FOUND error becomes an error result."""
+        body = {"data": {"repository": None}, "errors": [{"type": "NOT_FOUND"}]}
+        fetcher = mock_fetcher(lambda request: httpx.Response(200, json=body), use_graphql=True)
+
+        assert fetcher.get_repo_stats("octo/missing").error == "Repository not found"
+
+    def test_graphql_requires_token(self, monkeypatch):
+        """Test that REST is used without a token."""
+        monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+
+        assert not GitHubStats(use_graphql=True).use_graphql
+
+
+class TestResponseCache:
+    """Test ETag-based response caching."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Response cache in a temporary directory."""
+        cache = ResponseCache(tmp_path / "responses.sqlite", ttl=300.0)
+        yield cache
+        cache.close()
+
+    def cached_fetcher(self, handler, cache) -> GitHubStats:
+        """Build a REST fetcher using `cache`."""
+        fetcher = mock_fetcher(handler)
+        fetcher.cache = cache
+        return fetcher
+
+    def test_fresh_entry_skips_request(self, cache):
+        """Test that a response within the TTL is served from the cache."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"Python": 10}, headers={"ETag": '"v1"'})
+
+        fetcher = self.cached_fetcher(handler, cache)
+
+        assert fetcher.get_languages("octo/demo") == {"Python": 10}
+        assert fetcher.get_languages("octo/demo") == {"Python": 10}
+        assert len(calls) == 1
+
+    def test_stale_entry_is_revalidated(self, cache):
+        """Test that a stale entry sends If-None-Match and reuses the body on 304."""
+        cache.ttl = 0
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=REPO_PAYLOAD, headers={"ETag": '"v1"'})
+
+        fetcher = self.cached_fetcher(handler, cache)
+        first = fetcher.get_repo_stats("octo/demo")
+        second = fetcher.get_repo_stats("octo/demo")
+
+        assert [r.headers.get("if-none-match") for r in calls] == [None, '"v1"']
+        assert second.error is None
+        assert second.stars == first.stars
+
+    def test_cache_is_per_token(self, cache):
+        """Test that responses cached for one token aren't served to another."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(200, json={"Python": 10})
+
+        self.cached_fetcher(handler, cache).get_languages("octo/demo")
+        other = self.cached_fetcher(handler, cache)
+        other._credentials_id = "someone-else"
+        other.get_languages("octo/demo")
+
+        assert len(calls) == 2
@@ -0,0 +1,213 @@
+"""Tests for JSON/YAML/TOML Converter."""
+
+import json
+import logging
+
+import pytest
+
+from tools.json_converter.converter import (
+    ConversionFormat,
+    DataConverter,
+    _compile_query,
+    _compile_schema,
+)
+
+BIG_INT = 123456789012345678901234567890
+
+SAMPLE = {
+    "name": "demo",
+    "version": 3,
+    "ratio": 0.5,
+    "enabled": True,
+    "tags": ["cli", "héllo"],
+    "owner": {"login": "octo", "ids": [1, 2]},
+}
+
+FORMATS = [fmt.value for fmt in ConversionFormat]
+
+
+class TestConvert:
+    """Test parsing and serializing each format."""
+
+    @pytest.mark.parametrize("source", FORMATS)
+    @pytest.mark.parametrize("target", FORMATS)
+    def test_file_roundtrip(self, tmp_path, source, target):
+        """Test that data survives a conversion between every format pair."""
+        converter = DataConverter()
+        input_path = tmp_path / f"in.{source}"
+        output_path = tmp_path / f"out.{target}"
+        input_path.write_text(converter.convert(SAMPLE, ConversionFormat(source)), encoding="utf-8")
+
+        converter.convert_file(input_path, output_path, ConversionFormat(target))
+
+        assert converter.load_file(output_path) == SAMPLE
+
+    @pytest.mark.parametrize("fmt", FORMATS)
+    def test_parse_matches_load_file(self, tmp_path, fmt):
+        """Test that the string and file parsers agree."""
+        converter = DataConverter()
+        text = converter.convert(SAMPLE, ConversionFormat(fmt))
+        filepath = tmp_path / f"data.{fmt}"
+        filepath.write_text(text, encoding="utf-8")
+
+        assert converter.parse(text, ConversionFormat(fmt)) == SAMPLE
+        assert converter.load_file(filepath) == SAMPLE
+
+    def test_json_formatting(self):
+        """Test compact, 2-space and custom indentation."""
+        converter = DataConverter()
+        data = {"a": [1]}
+
+        assert converter.convert(data, ConversionFormat.JSON, pretty=False) == '{"a":[1]}'
+        assert converter.pretty_print(data, ConversionFormat.JSON) == '{\n  "a": [\n    1\n  ]\n}'
+        assert converter.pretty_print(data, ConversionFormat.JSON, indent=4) == json.dumps(
+            data, indent=4
+        )
+        assert converter.minify_json(SAMPLE) == json.dumps(
+            SAMPLE, separators=(",", ":"), ensure_ascii=False
+        )
+
+    def test_yaml_is_block_style_unicode(self):
+        """Test that YAML output keeps non-ASCII text and uses block style."""
+        output = DataConverter().convert({"tags": ["héllo"]}, ConversionFormat.YAML)
+
+        assert output == "tags:\n- héllo\n"
+
+    def test_unknown_suffix(self, tmp_path):
+        """Test that files without a known extension need an explicit format."""
+        filepath = tmp_path / "data.txt"
+        filepath.write_text('{"a": 1}', encoding="utf-8")
+        converter = DataConverter()
+
+        with pytest.raises(ValueError, match="Cannot auto-detect"):
+            converter.load_file(filepath)
+        assert converter.load_file(filepath, format=ConversionFormat.JSON) == {"a": 1}
+
+    def test_parse_error(self):
+        """Test that parse failures are reported as ValueError."""
+        with pytest.raises(ValueError, match="Failed to parse yaml"):
+            DataConverter().parse("a: [1", ConversionFormat.YAML)
+
+
+class TestQuery:
+    """Test JMESPath queries."""
+
+    def test_query(self):
+        """Test a query against nested data."""
+        assert DataConverter().query(SAMPLE, "owner.ids[-1]") == 2
+
+    def test_compiled_query_is_reused(self):
+        """Test that repeated queries reuse the compiled expression."""
+        _compile_query.cache_clear()
+        converter = DataConverter()
+
+        converter.query(SAMPLE, "tags[0]")
+        converter.query({"tags": ["x"]}, "tags[0]")
+
+        assert _compile_query.cache_info().hits == 1
+        assert _compile_query.cache_info().misses == 1
+
+    def test_invalid_query(self):
+        """Test that syntax errors are reported as ValueError."""
+        with pytest.raises(ValueError, match="Query failed"):
+            DataConverter().query(SAMPLE, "tags[")
+
+
+class TestValidate:
+    """Test JSON Schema validation."""
+
+    SCHEMA = {
+        "type": "object",
+        "required": ["name", "version"],
+        "properties": {"name": {"type": "string"}, "version": {"type": "integer"}},
+    }
+
+    def test_valid(self):
+        """Test that matching data passes."""
+        assert DataConverter().validate_json_schema(SAMPLE, self.SCHEMA) == (True, None)
+
+    def test_error_message(self):
+        """Test that the most relevant error is reported."""
+        valid, message = DataConverter().validate_json_schema(
+            {"name": 1, "version": 3}, self.SCHEMA
+        )
+
+        assert not valid
+        assert message.startswith("1 is not of type 'string'")
+
+    def test_invalid_schema(self):
+        """Test that a broken schema is reported instead of raised."""
+        valid, message = DataConverter().validate_json_schema({}, {"type": "nope"})
+
+        assert not valid
+        assert message.startswith("Validation error:")
+
+    def test_validator_is_reused(self):
+        """Test that an equal schema reuses the compiled validator."""
+        _compile_schema.cache_clear()
+        converter = DataConverter()
+
+        converter.validate_json_schema(SAMPLE, self.SCHEMA)
+        converter.validate_json_schema({}, dict(self.SCHEMA))
+
+        assert _compile_schema.cache_info().hits == 1
+
+
+class TestBatchConvert:
+    """Test directory conversion."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_bad_file_is_reported(self, tmp_path, caplog, max_workers):
+        """Test that one unparsable file doesn't stop the rest of the batch."""
+        input_dir = tmp_path / "in"
+        input_dir.mkdir()
+        (input_dir / "a.json").write_text('{"a": 1}', encoding="utf-8")
+        (input_dir / "b.yaml").write_text("b: 2\n", encoding="utf-8")
+        (input_dir / "bad.json").write_text("{not json", encoding="utf-8")
+        output_dir = tmp_path / "out"
+
+        with caplog.at_level(logging.INFO, logger="tools.json_converter.converter"):
+            count = DataConverter().batch_convert(
+                input_dir, output_dir, ConversionFormat.TOML, max_workers=max_workers
+            )
+
+        assert count == 2
+        assert sorted(p.name for p in output_dir.iterdir()) == ["a.toml", "b.toml"]
+        assert "Failed to convert bad.json: Failed to parse json" in caplog.text
+        assert "Converted 2/3 files to toml" in caplog.text
+
+    def test_missing_directory(self, tmp_path):
+        """Test that a missing input directory raises."""
+        with pytest.raises(FileNotFoundError):
+            DataConverter().batch_convert(tmp_path / "nope", tmp_path, ConversionFormat.JSON)
+
+
+class TestBigIntegers:
+    """Test integers that don't fit in 64 bits."""
+
+    @pytest.mark.parametrize("source", ["json", "yaml", "toml"])
+    @pytest.mark.parametrize("target", ["json", "yaml", "toml"])
+    def test_roundtrip(self, tmp_path, source, target):
+        """Test that a big integer survives a file conversion unchanged."""
+        converter = DataConverter()
+        input_path = tmp_path / f"in.{source}"
+        output_path = tmp_path / f"out.{target}"
+        input_path.write_text(
+            converter.convert({"big": BIG_INT, "small": -(2**63)}, ConversionFormat(source)),
+            encoding="utf-8",
+        )
+
+        converter.convert_file(input_path, output_path, ConversionFormat(target))
+
+        assert converter.load_file(output_path) == {"big": BIG_INT, "small": -(2**63)}
+
+    def test_parse_and_minify(self):
+        """Test JSON parsing and minifying of big integers."""
+        converter = DataConverter()
+        data = converter.parse('{"big": 123456789012345678901234567890}', ConversionFormat.JSON)
+
+        assert data == {"big": BIG_INT}
+        assert converter.minify_json(data) == '{"big":123456789012345678901234567890}'
+        assert "big: 123456789012345678901234567890" in converter.convert(
+            data, ConversionFormat.YAML
+        )
@@ -0,0 +1,92 @@
+"""Tests for the shared JSON serialization helpers."""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from shared.serialization import dump_records, dumps, loads
+
+
+@dataclass
+class Point:
+    """Small dataclass for serialization tests."""
+
+    x: int
+    when: datetime
+
+
+@pytest.mark.usefixtures("json_backend")
+class TestSerialization:
+    """Test dumps/loads with both JSON backends."""
+
+    def test_roundtrip(self):
+        """Test that plain data survives a dump and load unchanged."""
+        data = {"text": "héllo", "items": [1, 2.5, None, True], "nested": {"a": []}}
+
+        assert loads(dumps(data)) == data
+        assert loads(dumps(data).decode("utf-8")) == data
+
+    def test_compact_and_indented_output(self):
+        """Test the compact default and the 2-space indented form."""
+        assert dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+        assert dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+
+    def test_non_ascii_is_written_as_utf8(self):
+        """Test that non-ASCII text is not escaped."""
+        assert dumps("héllo") == '"héllo"'.encode()
+
+    def test_extra_types(self):
+        """Test dataclasses, datetimes, bytes and mappings."""
+        when = datetime(2024, 1, 2, 3, 4, 5)
+
+        assert loads(dumps(Point(x=1, when=when))) == {"x": 1, "when": "2024-01-02T03:04:05"}
+        assert loads(dumps(b"raw")) == "b'raw'"
+        assert loads(dumps({1: "one"})) == {"1": "one"}
+
+    def test_equal_instants_keep_their_offsets(self):
+        """Test that aware datetimes for the same instant keep their own offsets."""
+        utc = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+        plus_one = datetime(2024, 1, 1, 13, tzinfo=timezone(timedelta(hours=1)))
+
+        assert loads(dumps([utc, plus_one])) == [
+            "2024-01-01T12:00:00+00:00",
+            "2024-01-01T13:00:00+01:00",
+        ]
+
+    def test_integers_beyond_64_bits(self):
+        """Test that integers orjson can't encode are still written exactly."""
+        big = 123456789012345678901234567890
+
+        assert dumps({"big": big}) == b'{"big":123456789012345678901234567890}'
+        assert dumps([big], indent=True) == b"[\n  123456789012345678901234567890\n]"
+
+    def test_unsupported_type_raises(self):
+        """Test that unknown objects are rejected with TypeError."""
+        with pytest.raises(TypeError):
+            dumps(object())
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that both backends report bad input as ValueError."""
+        with pytest.raises(ValueError, match="char 1"):
+            loads(b"{not json")
+
+    def test_dump_records(self, tmp_path):
+        """Test the streamed envelope document."""
+        filepath = tmp_path / "records.json"
+
+        dump_records(filepath, ({"n": i} for i in range(3)), {"total": 3})
+
+        assert json.loads(filepath.read_text(encoding="utf-8")) == {
+            "total": 3,
+            "requests": [{"n": 0}, {"n": 1}, {"n": 2}],
+        }
+
+    def test_dump_records_jsonl(self, tmp_path):
+        """Test that a .jsonl path writes one record per line."""
+        filepath = tmp_path / "records.jsonl"
+
+        dump_records(filepath, [{"n": 0}, {"n": 1}], {"ignored": True})
+
+        assert filepath.read_text(encoding="utf-8") == '{"n":0}\n{"n":1}\n'
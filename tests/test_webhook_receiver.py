@@ -1,6 +1,8 @@
 """Tests for Webhook Receiver."""
 
+import asyncio
 import json
+import sys
 from datetime import datetime
 from pathlib import Path
 
@@ -8,6 +10,7 @@ import pytest
 
 from tools.webhook_receiver.receiver import (
     PARSERS,
+    HeaderDict,
     WebhookReceiver,
     WebhookRequest,
     detect_webhook_type,
@@ -61,6 +64,24 @@ class TestWebhookRequest:
         assert request.parser_type == "github"
         assert request.parsed_data == {"event": "push"}
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_webhook_request_uses_slots(self):
+        """Test that WebhookRequest instances carry no per-instance __dict__."""
+        request = WebhookRequest(
+            id="req_001",
+            timestamp=datetime.now(),
+            method="POST",
+            path="/webhook",
+            headers={},
+            query_params={},
+            body={},
+            source_ip="127.0.0.1",
+        )
+
+        assert not hasattr(request, "__dict__")
+        request.parser_type = "github"
+        assert request.parser_type == "github"
+
 
 class TestWebhookReceiver:
     """Test WebhookReceiver functionality."""
@@ -133,6 +154,24 @@ class TestWebhookReceiver:
         assert receiver.history[0].path == "/webhook/5"  # First 5 removed
         assert receiver.history[-1].path == "/webhook/14"
 
+    def test_history_is_bounded_deque(self):
+        """Test that history evicts the oldest entries without reallocating."""
+        receiver = WebhookReceiver(max_history=3)
+        history = receiver.history
+
+        for i in range(5):
+            receiver.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={},
+                source_ip="127.0.0.1",
+            )
+
+        assert receiver.history is history
+        assert [req.path for req in receiver.history] == ["/webhook/2", "/webhook/3", "/webhook/4"]
+
     def test_get_history_no_limit(self):
         """Test getting full history."""
         receiver = WebhookReceiver()
@@ -170,6 +209,8 @@ class TestWebhookReceiver:
         history = receiver.get_history(limit=3)
         assert len(history) == 3
         assert history[0].path == "/webhook/9"  # Most recent
+        assert len(receiver.get_history(limit=0)) == 10
+        assert len(receiver.get_history(limit=-1)) == 10
 
     def test_get_request(self):
         """Test getting specific request by ID."""
@@ -197,6 +238,23 @@ class TestWebhookReceiver:
         assert request is not None
         assert request.path == "/webhook/1"
 
+    def test_get_request_evicted(self):
+        """Test that evicted requests can no longer be looked up."""
+        receiver = WebhookReceiver(max_history=2)
+
+        for i in range(3):
+            receiver.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={},
+                source_ip="127.0.0.1",
+            )
+
+        assert receiver.get_request("req_00001") is None
+        assert receiver.get_request("req_00003").path == "/webhook/2"
+
     def test_get_request_not_found(self):
         """Test getting non-existent request."""
         receiver = WebhookReceiver()
@@ -220,7 +278,9 @@ class TestWebhookReceiver:
         count = receiver.clear_history()
         assert count == 5
         assert len(receiver.history) == 0
+        assert receiver.get_request("req_00001") is None
 
+    @pytest.mark.usefixtures("json_backend")
     def test_save_to_file(self, tmp_path):
         """Test saving webhook history to file."""
         receiver = WebhookReceiver()
@@ -247,6 +307,143 @@ class TestWebhookReceiver:
         assert len(data["requests"]) == 1
         assert data["requests"][0]["method"] == "POST"
 
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_and_load_roundtrip(self, tmp_path):
+        """Test that a saved history can be loaded back unchanged."""
+        receiver = WebhookReceiver()
+
+        original = receiver.add_request(
+            method="POST",
+            path="/webhook",
+            headers={"Content-Type": "application/json"},
+            query_params={"token": "abc"},
+            body={"text": "héllo", "items": [1, 2, 3]},
+            source_ip="127.0.0.1",
+        )
+
+        filepath = tmp_path / "webhooks.json"
+        receiver.save_to_file(filepath)
+
+        restored = WebhookReceiver()
+        assert restored.load_from_file(filepath) == 1
+
+        loaded = restored.history[0]
+        assert loaded.timestamp == original.timestamp
+        assert loaded.body == original.body
+        assert loaded.query_params == original.query_params
+        assert loaded.headers == {"content-type": "application/json"}
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_and_load_jsonl(self, tmp_path):
+        """Test exporting history as JSON Lines."""
+        receiver = WebhookReceiver()
+
+        for i in range(3):
+            receiver.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={"n": i},
+                source_ip="127.0.0.1",
+            )
+
+        filepath = tmp_path / "webhooks.jsonl"
+        receiver.save_to_file(filepath)
+
+        lines = filepath.read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[0])["path"] == "/webhook/0"
+
+        restored = WebhookReceiver()
+        assert restored.load_from_file(filepath) == 3
+        assert restored.history[-1].body == {"n": 2}
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_async_save_and_load(self, tmp_path):
+        """Test the event-loop friendly save and load variants."""
+        receiver = WebhookReceiver()
+        for i in range(3):
+            receiver.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={"n": i},
+                source_ip="127.0.0.1",
+            )
+
+        filepath = tmp_path / "webhooks.json"
+        asyncio.run(receiver.asave_to_file(filepath))
+
+        restored = WebhookReceiver()
+        assert asyncio.run(restored.aload_from_file(filepath)) == 3
+        assert [req.path for req in restored.history] == [req.path for req in receiver.history]
+        assert json.loads(filepath.read_text())["total_requests"] == 3
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_load_more_than_max_history(self, tmp_path):
+        """Test that loading keeps only the newest max_history requests."""
+        source = WebhookReceiver()
+        for i in range(5):
+            source.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={},
+                source_ip="127.0.0.1",
+            )
+
+        filepath = tmp_path / "webhooks.json"
+        source.save_to_file(filepath)
+
+        receiver = WebhookReceiver(max_history=2)
+        assert receiver.load_from_file(filepath) == 5
+        assert [req.path for req in receiver.history] == ["/webhook/3", "/webhook/4"]
+        assert receiver.get_request("req_00001") is None
+
+    def test_duplicate_ids_after_load(self):
+        """Test that evicting a loaded request keeps a newer request with the same id."""
+        receiver = WebhookReceiver(max_history=2)
+        receiver.history.append(
+            WebhookRequest(
+                id="req_00001",
+                timestamp=datetime.now(),
+                method="POST",
+                path="/loaded",
+                headers={},
+                query_params={},
+                body={},
+                source_ip="127.0.0.1",
+            )
+        )
+
+        for i in range(2):
+            receiver.add_request(
+                method="POST",
+                path=f"/webhook/{i}",
+                headers={},
+                query_params={},
+                body={},
+                source_ip="127.0.0.1",
+            )
+
+        assert receiver.get_request("req_00001").path == "/webhook/0"
+
+    @pytest.mark.usefixtures("json_backend")
+    def test_save_empty_history(self, tmp_path):
+        """Test that an empty history still produces valid JSON."""
+        filepath = tmp_path / "webhooks.json"
+        WebhookReceiver().save_to_file(filepath)
+
+        with open(filepath) as f:
+            data = json.load(f)
+
+        assert data["total_requests"] == 0
+        assert data["requests"] == []
+
+    @pytest.mark.usefixtures("json_backend")
     def test_load_from_file(self, tmp_path):
         """Test loading webhook history from file."""
         # Create test file
@@ -288,6 +485,7 @@ class TestWebhookReceiver:
         assert len(receiver.history) == 2
         assert receiver.history[0].id == "req_001"
         assert receiver.history[1].id == "req_002"
+        assert receiver.get_request("req_002").path == "/webhook/2"
 
 
 class TestGitHubParser:
@@ -352,6 +550,25 @@ class TestGitHubParser:
         assert parsed["issue_number"] == 123
         assert parsed["issue_title"] == "Bug report"
 
+    def test_parse_unknown_event(self):
+        """Test that unhandled events only report the event name."""
+        headers = {"x-github-event": "star"}
+        body = {"action": "created"}
+
+        parsed = parse_github_webhook(headers, body)
+        assert parsed == {"event": "star"}
+
+    def test_parse_push_event_missing_fields(self):
+        """Test that missing or null nested objects yield None."""
+        headers = {"x-github-event": "push"}
+        body = {"repository": None}
+
+        parsed = parse_github_webhook(headers, body)
+
+        assert parsed["repository"] is None
+        assert parsed["commits"] == 0
+        assert parsed["pusher"] is None
+
     def test_parse_no_event_header(self):
         """Test parsing without event header."""
         headers = {}
@@ -419,6 +636,14 @@ class TestStripeParser:
         assert parsed["customer_id"] == "cus_123"
         assert parsed["email"] == "test@example.com"
 
+    def test_parse_other_event(self):
+        """Test that other resources only get the common fields."""
+        body = {"id": "evt_789", "type": "invoice.paid", "data": {"object": {"id": "in_1"}}}
+
+        parsed = parse_stripe_webhook({}, body)
+
+        assert parsed == {"event": "invoice.paid", "id": "evt_789", "created": None}
+
 
 class TestSlackParser:
     """Test Slack webhook parser."""
@@ -491,6 +716,61 @@ class TestDetectWebhookType:
         assert webhook_type == "github"
 
 
+class TestHeaderDict:
+    """Test case-insensitive header mapping."""
+
+    def test_keys_are_lowercased(self):
+        """Test that keys are normalized once on construction."""
+        headers = HeaderDict({"X-GitHub-Event": "push", "Content-Type": "application/json"})
+
+        assert list(headers) == ["x-github-event", "content-type"]
+        assert headers["X-GITHUB-EVENT"] == "push"
+        assert headers.get("content-TYPE") == "application/json"
+        assert "Content-Type" in headers
+
+    def test_add_request_normalizes_headers(self):
+        """Test that stored requests carry case-insensitive headers."""
+        receiver = WebhookReceiver()
+        request = receiver.add_request(
+            method="POST",
+            path="/webhook",
+            headers={"X-GitHub-Event": "push"},
+            query_params={},
+            body={},
+            source_ip="127.0.0.1",
+        )
+
+        assert isinstance(request.headers, HeaderDict)
+        assert parse_github_webhook(request.headers, {})["event"] == "push"
+
+    def test_accepts_pairs(self):
+        """Test construction from (key, value) pairs, as dict() allows."""
+        headers = HeaderDict([("X-GitHub-Event", "push")])
+
+        assert headers == {"x-github-event": "push"}
+        assert HeaderDict() == {}
+
+    def test_save_and_load_without_orjson(self, tmp_path, monkeypatch):
+        """Test that the stdlib fallback can export stored headers."""
+        monkeypatch.setattr("shared.serialization.orjson", None)
+        receiver = WebhookReceiver()
+        receiver.add_request(
+            method="POST",
+            path="/webhook",
+            headers={"X-GitHub-Event": "push"},
+            query_params={},
+            body={},
+            source_ip="127.0.0.1",
+        )
+
+        filepath = tmp_path / "webhooks.json"
+        receiver.save_to_file(filepath)
+
+        restored = WebhookReceiver()
+        assert restored.load_from_file(filepath) == 1
+        assert restored.history[0].headers == {"x-github-event": "push"}
+
+
 class TestParsers:
     """Test parsers registry."""
 
@@ -503,3 +783,79 @@ class TestParsers:
         assert callable(PARSERS["github"])
         assert callable(PARSERS["stripe"])
         assert callable(PARSERS["slack"])
+
+
+class TestServer:
+    """Test the receiving endpoint."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        """Test client backed by a fresh receiver."""
+        from fastapi.testclient import TestClient
+
+        from tools.webhook_receiver import cli
+
+        monkeypatch.setattr(cli, "receiver", WebhookReceiver())
+        return TestClient(cli.app)
+
+    def test_receives_json_webhook(self, client):
+        """Test that a JSON body is parsed and stored."""
+        from tools.webhook_receiver import cli
+
+        response = client.post(
+            "/hooks/github", json={"ref": "refs/heads/main"}, headers={"X-GitHub-Event": "push"}
+        )
+
+        assert response.status_code == 200
+        request = cli.receiver.get_request(response.json()["id"])
+        assert request.body == {"ref": "refs/heads/main"}
+        assert request.parser_type == "github"
+
+    def test_query_params(self, client):
+        """Test that query parameters are stored only when present."""
+        from tools.webhook_receiver import cli
+
+        with_query = client.post("/hook", params={"token": "abc"}, content=b"x").json()["id"]
+        without_query = client.post("/hook", content=b"x").json()["id"]
+
+        assert cli.receiver.get_request(with_query).query_params == {"token": "abc"}
+        assert cli.receiver.get_request(without_query).query_params == {}
+
+    def test_undecodable_bodies_are_kept_as_text(self, client):
+        """Test that invalid JSON and invalid UTF-8 fall back to replaced text."""
+        from tools.webhook_receiver import cli
+
+        response = client.post(
+            "/hook",
+            content=b'{"broken": \xff',
+            headers={"Content-Type": "application/json; charset=utf-8"},
+        )
+
+        assert response.status_code == 200
+        assert cli.receiver.get_request(response.json()["id"]).body == '{"broken": \ufffd'
+
+    def test_oversized_body_is_rejected(self, client, monkeypatch):
+        """Test that bodies over MAX_BODY_BYTES get a 413 and are not stored."""
+        from tools.webhook_receiver import cli
+
+        monkeypatch.setattr(cli, "MAX_BODY_BYTES", 16)
+
+        assert client.post("/hook", content=b"x" * 17).status_code == 413
+        assert client.post("/hook", content=b"x" * 16).status_code == 200
+        assert len(cli.receiver.history) == 1
+
+    def test_status_and_history_endpoints(self, client):
+        """Test that the catch-all route doesn't shadow the built-in endpoints."""
+        client.post("/hook", json={"type": "url_verification"})
+        client.put("/other", content=b"plain")
+
+        status = client.get("/").json()
+        history = client.get("/_history", params={"limit": 1}).json()
+
+        assert status["status"] == "running"
+        assert [req["path"] for req in status["recent_requests"]] == ["/other", "/hook"]
+        assert (history["total"], history["returned"]) == (2, 1)
+        assert datetime.fromisoformat(history["requests"][0]["timestamp"])
+        assert client.get("/_history", params={"limit": -1}).status_code == 422
+        assert client.delete("/_history").json() == {"status": "cleared", "count": 2}
+        assert client.get("/").json()["total_requests"] == 0
@@ -1,5 +1,5 @@
 """API Tester CLI - HTTP API testing tool."""
 
-from .tester import APITester, HTTPMethod
+from .tester import APIRequest, APITester, HTTPMethod
 
-__all__ = ["APITester", "HTTPMethod"]
+__all__ = ["APIRequest", "APITester", "HTTPMethod"]
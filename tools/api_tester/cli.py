@@ -1,21 +1,20 @@
 """CLI interface for API Tester."""
 
-import json
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-from shared.cli import error, handle_errors, info, success, warning
+from shared.cli import console, error, handle_errors, info, success, warning
 from shared.logger import setup_logger
+from shared.serialization import dumps, loads
 
-from .tester import APITester, HTTPMethod
+from .tester import APITester
 
-console = Console()
+# Status line color by status class (index = status_code // 100, capped at 5)
+_STATUS_COLORS = ("yellow", "yellow", "green", "yellow", "red", "red")
 
 
 def display_response(response, show_body: bool = True) -> None:
@@ -25,12 +24,12 @@ def display_response(response, show_body: bool = True) -> None:
         return
 
     # Status line
-    status_color = "green" if 200 <= response.status_code < 300 else "red" if response.status_code >= 400 else "yellow"
+    status_color = _STATUS_COLORS[min(response.status_code // 100, 5)]
     console.print(f"\n[{status_color}]HTTP {response.status_code}[/{status_color}] - {response.elapsed_ms:.0f}ms")
 
     # Headers
     console.print("\n[bold yellow]Headers:[/bold yellow]")
-    for key, value in list(response.headers.items())[:10]:  # Show first 10
+    for key, value in islice(response.headers.items(), 10):  # Show first 10
         console.print(f"  {key}: {value}")
 
     # Body
@@ -38,9 +37,17 @@ def display_response(response, show_body: bool = True) -> None:
         console.print("\n[bold yellow]Body:[/bold yellow]")
 
         if isinstance(response.body, dict) or isinstance(response.body, list):
-            body_str = json.dumps(response.body, indent=2)
-            syntax = Syntax(body_str, "json", theme="monokai", line_numbers=False)
-            console.print(syntax)
+            body_str = dumps(response.body, indent=True).decode("utf-8")
+
+            if console.is_terminal:
+                # Deferred: rich.syntax pulls in pygments, which dominates startup
+                from rich.syntax import Syntax
+
+                syntax = Syntax(body_str, "json", theme="monokai", line_numbers=False)
+                console.print(syntax)
+            else:
+                # Piped output: plain JSON, no highlighting
+                print(body_str)
         else:
             console.print(str(response.body)[:1000])
 
@@ -171,17 +178,16 @@ def main(
     json_data = None
     if data:
         try:
-            json_data = json.loads(data)
-        except json.JSONDecodeError as e:
+            json_data = loads(data)
+        except ValueError as e:
             error(f"Invalid JSON data: {e}")
             sys.exit(1)
 
     # Make request
     info(f"{method} {url}")
 
-    http_method = HTTPMethod(method.upper())
     response = tester.request(
-        method=http_method,
+        method=method,
         url=url,
         headers=headers_dict if headers_dict else None,
         json_data=json_data,
@@ -200,8 +206,8 @@ def main(
         # Save to file if requested
         if output:
             if isinstance(response.body, (dict, list)):
-                with open(output, "w") as f:
-                    json.dump(response.body, f, indent=2)
+                with open(output, "wb") as f:
+                    f.write(dumps(response.body, indent=True))
             else:
                 with open(output, "w") as f:
                     f.write(str(response.body))
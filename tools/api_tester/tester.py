@@ -1,15 +1,20 @@
 """Core API testing logic."""
 
-import json
+import asyncio
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Mapping, Optional, Union
 
 import httpx
 
+from shared.compat import DATACLASS_SLOTS
 from shared.logger import get_logger
+from shared.serialization import dump_records, loads
 
 logger = get_logger(__name__)
 
@@ -26,37 +31,78 @@ class HTTPMethod(str, Enum):
     OPTIONS = "OPTIONS"
 
 
-@dataclass
+def _method_name(method: Union[HTTPMethod, str]) -> str:
+    """Return the upper-case method name for an HTTPMethod or plain string."""
+    return method.value if isinstance(method, HTTPMethod) else method.upper()
+
+
+@dataclass(**DATACLASS_SLOTS)
 class APIResponse:
     """API response information."""
 
     url: str
     method: str
     status_code: int
-    headers: Dict[str, str]
+    headers: Mapping[str, str]
     body: Any
     elapsed_ms: float
     timestamp: datetime
     error: Optional[str] = None
 
 
+@dataclass
+class APIRequest:
+    """Request description for batched execution."""
+
+    method: Union[HTTPMethod, str]
+    url: str
+    headers: Optional[Dict[str, str]] = None
+    params: Optional[Dict[str, str]] = None
+    data: Optional[Any] = None
+    json_data: Optional[Dict] = None
+    auth: Optional[tuple] = None
+    follow_redirects: bool = True
+
+
 class APITester:
     """HTTP API testing tool with history and collections."""
 
-    def __init__(self, timeout: float = 30.0):
+    def __init__(self, timeout: float = 30.0, max_history: int = 100):
         """
         Initialize API tester.
 
         Args:
             timeout: Request timeout in seconds
+            max_history: Maximum number of responses to keep in memory
         """
         self.timeout = timeout
-        self.history: List[APIResponse] = []
+        self.max_history = max_history
+        self.history: Deque[APIResponse] = deque(maxlen=max_history)
+
+        # Shared client so connections are pooled and kept alive across requests
+        self._client = httpx.Client(
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
         logger.debug("Initialized APITester")
 
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "APITester":
+        """Use the tester as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the HTTP client on exit."""
+        self.close()
+
     def request(
         self,
-        method: HTTPMethod,
+        method: Union[HTTPMethod, str],
         url: str,
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, str]] = None,
@@ -69,7 +115,7 @@ class APITester:
         Make HTTP request.
 
         Args:
-            method: HTTP method
+            method: HTTP method (HTTPMethod or method name)
             url: Request URL
             headers: Request headers
             params: Query parameters
@@ -81,68 +127,183 @@ class APITester:
         Returns:
             APIResponse object
         """
-        logger.info(f"{method.value} {url}")
+        method_str = _method_name(method)
+        logger.info(f"{method_str} {url}")
 
         start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
 
         try:
-            with httpx.Client(
-                timeout=self.timeout,
+            response = self._client.request(
+                method=method_str,
+                url=url,
+                headers=headers,
+                params=params,
+                data=data,
+                json=json_data,
+                auth=auth,
                 follow_redirects=follow_redirects,
-            ) as client:
-                response = client.request(
-                    method=method.value,
-                    url=url,
-                    headers=headers,
-                    params=params,
-                    data=data,
-                    json=json_data,
-                    auth=auth,
-                )
-
-                elapsed = (datetime.now() - start_time).total_seconds() * 1000
-
-                # Try to parse response body
-                content_type = response.headers.get("content-type", "")
-
-                if "application/json" in content_type:
-                    try:
-                        body = response.json()
-                    except:
-                        body = response.text
-                else:
-                    body = response.text
-
-                api_response = APIResponse(
-                    url=str(response.url),
-                    method=method.value,
-                    status_code=response.status_code,
-                    headers=dict(response.headers),
-                    body=body,
-                    elapsed_ms=elapsed,
-                    timestamp=start_time,
-                )
-
-                self.history.append(api_response)
-                return api_response
+            )
+            api_response = self._build_response(method_str, response, start_time, start_ns)
 
         except httpx.RequestError as e:
-            elapsed = (datetime.now() - start_time).total_seconds() * 1000
             logger.error(f"Request failed: {e}")
+            api_response = self._build_error(method_str, url, start_time, start_ns, e)
+
+        self.history.append(api_response)
+        return api_response
+
+    async def arequest(
+        self,
+        method: Union[HTTPMethod, str],
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[Any] = None,
+        json_data: Optional[Dict] = None,
+        auth: Optional[tuple] = None,
+        follow_redirects: bool = True,
+    ) -> APIResponse:
+        """
+        Make HTTP request asynchronously.
+
+        Takes the same arguments as request(). The async client is created on
+        first use and must be released with aclose() (run_many does this).
+
+        Returns:
+            APIResponse object
+        """
+        method_str = _method_name(method)
+        logger.info(f"{method_str} {url}")
+
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
 
-            api_response = APIResponse(
+        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
+
+        try:
+            response = await self._async_client.request(
+                method=method_str,
                 url=url,
-                method=method.value,
-                status_code=0,
-                headers={},
-                body=None,
-                elapsed_ms=elapsed,
-                timestamp=start_time,
-                error=str(e),
+                headers=headers,
+                params=params,
+                data=data,
+                json=json_data,
+                auth=auth,
+                follow_redirects=follow_redirects,
             )
+            api_response = self._build_response(method_str, response, start_time, start_ns)
 
-            self.history.append(api_response)
-            return api_response
+        except httpx.RequestError as e:
+            logger.error(f"Request failed: {e}")
+            api_response = self._build_error(method_str, url, start_time, start_ns, e)
+
+        self.history.append(api_response)
+        return api_response
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def run_many(self, requests: List[APIRequest], concurrency: int = 32) -> List[APIResponse]:
+        """
+        Run several requests concurrently.
+
+        Network waits overlap instead of being paid one after another, so this
+        is the preferred path for load testing and for replaying many requests.
+        At most `concurrency` requests are in flight at once.
+
+        Args:
+            requests: Requests to send
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of APIResponse in the same order as `requests`
+        """
+        return asyncio.run(self._gather(requests, concurrency))
+
+    async def _gather(self, requests: List[APIRequest], concurrency: int) -> List[APIResponse]:
+        """Send requests through the async client, capped by a semaphore."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(req: APIRequest) -> APIResponse:
+            async with semaphore:
+                return await self.arequest(
+                    req.method,
+                    req.url,
+                    headers=req.headers,
+                    params=req.params,
+                    data=req.data,
+                    json_data=req.json_data,
+                    auth=req.auth,
+                    follow_redirects=req.follow_redirects,
+                )
+
+        try:
+            return list(await asyncio.gather(*(send(req) for req in requests)))
+        finally:
+            await self.aclose()
+
+    def _build_response(
+        self,
+        method: str,
+        response: httpx.Response,
+        start_time: datetime,
+        start_ns: int,
+    ) -> APIResponse:
+        """Create APIResponse from an httpx response."""
+        elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        # Try to parse response body
+        content_type = response.headers.get("content-type", "")
+
+        if "application/json" in content_type:
+            try:
+                body = loads(response.content)
+            except ValueError:
+                body = response.text
+        else:
+            body = response.text
+
+        return APIResponse(
+            url=str(response.url),
+            method=method,
+            status_code=response.status_code,
+            # httpx.Headers is already a case-insensitive mapping; no copy needed
+            headers=response.headers,
+            body=body,
+            elapsed_ms=elapsed,
+            timestamp=start_time,
+        )
+
+    def _build_error(
+        self,
+        method: str,
+        url: str,
+        start_time: datetime,
+        start_ns: int,
+        exc: Exception,
+    ) -> APIResponse:
+        """Create APIResponse for a failed request."""
+        elapsed = (time.perf_counter_ns() - start_ns) / 1_000_000
+
+        return APIResponse(
+            url=url,
+            method=method,
+            status_code=0,
+            headers={},
+            body=None,
+            elapsed_ms=elapsed,
+            timestamp=start_time,
+            error=str(exc),
+        )
 
     def get(self, url: str, **kwargs) -> APIResponse:
         """Make GET request."""
@@ -169,15 +330,13 @@ class APITester:
         Get request history.
 
         Args:
-            limit: Maximum number of requests to return
+            limit: Maximum number of requests to return (None, zero or a
+                negative value returns the whole history)
 
         Returns:
             List of APIResponse (most recent first)
         """
-        history = list(reversed(self.history))
-        if limit:
-            history = history[:limit]
-        return history
+        return list(islice(reversed(self.history), limit if limit and limit > 0 else None))
 
     def clear_history(self) -> int:
         """Clear request history."""
@@ -186,26 +345,12 @@ class APITester:
         return count
 
     def save_history(self, filepath: Path) -> None:
-        """Save history to JSON file."""
-        data = {
-            "saved_at": datetime.now().isoformat(),
-            "total": len(self.history),
-            "requests": [
-                {
-                    "url": r.url,
-                    "method": r.method,
-                    "status_code": r.status_code,
-                    "elapsed_ms": r.elapsed_ms,
-                    "timestamp": r.timestamp.isoformat(),
-                    "headers": r.headers,
-                    "body": r.body if not isinstance(r.body, (bytes, bytearray)) else str(r.body),
-                    "error": r.error,
-                }
-                for r in self.history
-            ],
-        }
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        """
+        Save history to JSON file (or JSON Lines for a ``.jsonl`` path).
+
+        Responses are streamed one at a time through a buffered writer.
+        """
+        envelope = {"saved_at": datetime.now(), "total": len(self.history)}
+        dump_records(filepath, self.history, envelope)
 
         logger.info(f"Saved history to {filepath}")
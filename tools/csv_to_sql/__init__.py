@@ -1,5 +1,6 @@
 """CSV to SQL Converter - Generate SQL from CSV files."""
 
-from .converter import CSVToSQL, ColumnType
+from .converter import CSVToSQL, ColumnType, DataFormat
+from .schema_cache import SchemaCache
 
-__all__ = ["CSVToSQL", "ColumnType"]
+__all__ = ["CSVToSQL", "ColumnType", "DataFormat", "SchemaCache"]
@@ -9,7 +9,8 @@ import click
 from shared.cli import error, handle_errors, info, success
 from shared.logger import setup_logger
 
-from .converter import CSVToSQL, SQLDialect
+from .converter import CSVToSQL, DataFormat, SQLDialect
+from .schema_cache import SchemaCache
 
 
 @click.command()
@@ -35,6 +36,13 @@ from .converter import CSVToSQL, SQLDialect
     default=1000,
     help="Rows per INSERT statement",
 )
+@click.option(
+    "--format",
+    "data_format",
+    type=click.Choice(["inserts", "copy"], case_sensitive=False),
+    default="inserts",
+    help="Emit rows as INSERT batches or a PostgreSQL COPY block",
+)
 @click.option(
     "--schema-only",
     "-s",
@@ -51,6 +59,16 @@ from .converter import CSVToSQL, SQLDialect
     is_flag=True,
     help="CSV has no header row",
 )
+@click.option(
+    "--arrow",
+    is_flag=True,
+    help="Infer the schema with pyarrow (faster on large files; needs the arrow extra)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Don't reuse or store the inferred schema",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @handle_errors
 def main(
@@ -59,15 +77,19 @@ def main(
     output: Optional[Path],
     dialect: str,
     batch_size: int,
+    data_format: str,
     schema_only: bool,
     primary_key: Optional[str],
     no_header: bool,
+    arrow: bool,
+    no_cache: bool,
     verbose: bool,
 ):
     """
     CSV to SQL Converter - Generate SQL from CSV files.
 
     Automatically infers schema and generates CREATE TABLE + INSERT statements.
+    Inferred schemas are cached and reused until the CSV file changes.
 
     Examples:
 
@@ -94,6 +116,10 @@ def main(
         \b
         # Batch inserts
         csv2sql data.csv --table data --batch-size 500 --output data.sql
+
+        \b
+        # PostgreSQL COPY block for fast bulk loading (run with psql)
+        csv2sql large.csv --table big_table --format copy --output load.sql
     """
     # Setup logging
     log_level = "DEBUG" if verbose else "INFO"
@@ -101,24 +127,30 @@ def main(
 
     # Initialize converter
     sql_dialect = SQLDialect(dialect.lower())
-    converter = CSVToSQL(dialect=sql_dialect)
+    schema_cache = None if no_cache else SchemaCache()
+    converter = CSVToSQL(dialect=sql_dialect, schema_cache=schema_cache, use_arrow=arrow)
 
     info(f"Converting {csv_file} to {dialect.upper()} SQL")
 
     try:
-        # Convert
-        sql = converter.convert(
-            csv_path=csv_file,
-            table_name=table,
-            output_path=output,
-            batch_size=batch_size,
-            schema_only=schema_only,
-            primary_key=primary_key,
-        )
-
-        # Print to stdout if no output file
-        if not output:
-            print(sql)
+        # Stream statements straight to the output file, or to stdout
+        sink = open(output, "w", encoding="utf-8") if output else sys.stdout
+        try:
+            converter.convert_stream(
+                csv_path=csv_file,
+                table_name=table,
+                sink=sink,
+                batch_size=batch_size,
+                schema_only=schema_only,
+                primary_key=primary_key,
+                has_header=not no_header,
+                data_format=DataFormat(data_format.lower()),
+            )
+        finally:
+            if output:
+                sink.close()
+            if schema_cache:
+                schema_cache.close()
 
         success(f"Conversion completed!")
 
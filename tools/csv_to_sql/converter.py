@@ -1,15 +1,107 @@
 """Core CSV to SQL conversion logic."""
 
 import csv
-from dataclasses import dataclass
+import io
+import re
+from dataclasses import asdict, dataclass
 from enum import Enum
+from itertools import chain, islice, zip_longest
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
 
 from shared.logger import get_logger
 
+from .schema_cache import SchemaCache
+
+try:
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.types as pa_types
+except ImportError:  # pragma: no cover - exercised only without the "arrow" extra
+    pa_csv = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# Read size for the Arrow inference sample (one block is parsed)
+_ARROW_BLOCK_SIZE = 1 << 20
+_ARROW_TRUE_VALUES = ["true", "True", "TRUE", "yes", "Yes", "YES"]
+_ARROW_FALSE_VALUES = ["false", "False", "FALSE", "no", "No", "NO"]
+
+# Type-detection patterns. Matching with compiled patterns via map() keeps the
+# per-value loop in C instead of a Python-level try/except per cell.
+_INTEGER_RE = re.compile(r"\s*[+-]?[0-9]+\s*")
+# Any SQL numeric literal, integers included, so mixed columns widen to DECIMAL
+_NUMERIC_RE = re.compile(r"\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*")
+_BOOLEAN_VALUES = frozenset({"true", "false", "1", "0", "yes", "no"})
+_BOOLEAN_TRUE = frozenset({"true", "1", "yes"})
+# Common spellings of true, matched without lowercasing the value first
+_BOOLEAN_TRUE_FAST = _BOOLEAN_TRUE | {"True", "TRUE", "Yes", "YES"}
+# Common date formats: YYYY-MM-DD, DD/MM/YYYY, MM/DD/YYYY
+_DATE_RE = re.compile(r"(?:\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}|\d{2}-\d{2}-\d{4})$")
+# ISO format or common datetime formats (prefix match, time zone etc. allowed)
+_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}")
+
+# COPY text format escapes
+_COPY_SPECIAL_RE = re.compile(r"[\\\t\n\r]")
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+# Identifier sanitizing
+_NON_WORD_RE = re.compile(r"[^\w]")
+_UNDERSCORES_RE = re.compile(r"_+")
+
+
+# Per-type value formatters, chosen once per column by CSVToSQL._make_formatter.
+# Empty and whitespace-only values are written as NULL.
+
+
+def _format_numeric(value: str) -> str:
+    """Numbers are written as-is."""
+    return "NULL" if not value or value.isspace() else value
+
+
+def _is_true(value: str) -> bool:
+    """Whether a boolean column value means true."""
+    return value in _BOOLEAN_TRUE_FAST or value.lower() in _BOOLEAN_TRUE
+
+
+def _format_boolean_keyword(value: str) -> str:
+    """Booleans as TRUE/FALSE (PostgreSQL)."""
+    if not value or value.isspace():
+        return "NULL"
+    return "TRUE" if _is_true(value) else "FALSE"
+
+
+def _format_boolean_int(value: str) -> str:
+    """Booleans as 1/0 (MySQL, SQLite, MSSQL)."""
+    if not value or value.isspace():
+        return "NULL"
+    return "1" if _is_true(value) else "0"
+
+
+def _format_string(value: str) -> str:
+    """String types - escape quotes."""
+    if not value or value.isspace():
+        return "NULL"
+    if "'" in value:
+        value = value.replace("'", "''")
+    return "'" + value + "'"
+
+
+def _format_copy_text(value: str) -> str:
+    """Values in COPY text format: backslash-escaped, \\N for NULL."""
+    if not value or value.isspace():
+        return "\\N"
+    if _COPY_SPECIAL_RE.search(value):
+        return value.translate(_COPY_ESCAPES)
+    return value
+
+
+def _format_copy_boolean(value: str) -> str:
+    """Booleans in COPY text format."""
+    if not value or value.isspace():
+        return "\\N"
+    return "t" if _is_true(value) else "f"
+
 
 class ColumnType(str, Enum):
     """SQL column types."""
@@ -33,6 +125,13 @@ class SQLDialect(str, Enum):
     MSSQL = "mssql"
 
 
+class DataFormat(str, Enum):
+    """How table rows are emitted."""
+
+    INSERTS = "inserts"  # Multi-row INSERT statements (all dialects)
+    COPY = "copy"  # COPY ... FROM STDIN block (PostgreSQL)
+
+
 @dataclass
 class ColumnDefinition:
     """Definition of a table column."""
@@ -51,14 +150,26 @@ class CSVToSQL:
     Supports schema inference and multiple SQL dialects.
     """
 
-    def __init__(self, dialect: SQLDialect = SQLDialect.POSTGRESQL):
+    def __init__(
+        self,
+        dialect: SQLDialect = SQLDialect.POSTGRESQL,
+        schema_cache: Optional[SchemaCache] = None,
+        use_arrow: bool = False,
+    ):
         """
         Initialize CSV to SQL converter.
 
         Args:
             dialect: SQL dialect to use
+            schema_cache: Reuse inferred schemas across runs (disabled if None)
+            use_arrow: Infer schemas with pyarrow's CSV reader when installed
         """
         self.dialect = dialect
+        self.schema_cache = schema_cache
+
+        if use_arrow and pa_csv is None:
+            logger.warning("pyarrow is not installed; using built-in schema inference")
+        self.use_arrow = use_arrow and pa_csv is not None
         logger.debug(f"Initialized CSVToSQL with dialect: {dialect}")
 
     def infer_schema(
@@ -78,38 +189,172 @@ class CSVToSQL:
         Returns:
             List of ColumnDefinition objects
         """
+        cache_key = self._schema_cache_key(filepath, sample_size, has_header)
+        cached = self._get_cached_schema(cache_key)
+        if cached is not None:
+            return cached
+
         logger.info(f"Inferring schema from {filepath}")
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
+        if self.use_arrow:
+            columns = self._infer_schema_arrow(filepath, sample_size, has_header)
+        else:
+            with open(filepath, "r", encoding="utf-8") as f:
+                header, samples = self._read_sample(csv.reader(f), sample_size, has_header)
+            columns = self._build_columns(header, samples)
+
+        self._store_schema(cache_key, columns)
+        return columns
+
+    def _infer_schema_arrow(
+        self,
+        filepath: Path,
+        sample_size: int,
+        has_header: bool,
+    ) -> List[ColumnDefinition]:
+        """
+        Infer schema with pyarrow's multithreaded CSV reader.
+
+        Types come from Arrow's own inference on the first block of the file,
+        so formats it doesn't parse (e.g. DD/MM/YYYY dates) stay strings.
+
+        Args:
+            filepath: Path to CSV file
+            sample_size: Number of rows to sample for type inference
+            has_header: Whether CSV has header row
+
+        Returns:
+            List of ColumnDefinition objects
+        """
+        reader = pa_csv.open_csv(
+            filepath,
+            read_options=pa_csv.ReadOptions(
+                block_size=_ARROW_BLOCK_SIZE, autogenerate_column_names=not has_header
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                strings_can_be_null=True,
+                true_values=_ARROW_TRUE_VALUES,
+                false_values=_ARROW_FALSE_VALUES,
+            ),
+        )
+        schema = reader.schema
+        try:
+            batch = reader.read_next_batch().slice(0, sample_size)
+        except StopIteration:
+            batch = None  # header only
+        finally:
+            reader.close()
 
-            # Read header
-            if has_header:
-                header = next(reader)
-            else:
-                # Use column indices as names
-                first_row = next(reader)
-                header = [f"column_{i}" for i in range(len(first_row))]
-                # Reset to read data
-                f.seek(0)
-                reader = csv.reader(f)
-
-            # Sample data
-            samples = []
-            for i, row in enumerate(reader):
-                if i >= sample_size:
-                    break
-                if has_header and i == 0:
-                    continue
-                samples.append(row)
-
-        # Infer types
         columns = []
-        num_cols = len(header)
+        for col_idx, field in enumerate(schema):
+            name = field.name if has_header else f"column_{col_idx}"
+            values = batch.column(col_idx) if batch is not None else None
+            col_type, max_length = self._arrow_column_type(field.type, values)
+
+            columns.append(
+                ColumnDefinition(
+                    name=self._sanitize_name(name),
+                    type=col_type,
+                    length=max_length if col_type == ColumnType.VARCHAR else None,
+                    nullable=values is not None and values.null_count > 0,
+                )
+            )
+
+        logger.info(f"Inferred {len(columns)} columns")
+        return columns
+
+    def _arrow_column_type(self, arrow_type: Any, values: Any) -> tuple[ColumnType, Optional[int]]:
+        """Map an Arrow column type (and its sampled values) to a ColumnType."""
+        if values is None or pa_types.is_null(arrow_type):
+            return (ColumnType.VARCHAR, 255)
+
+        if pa_types.is_integer(arrow_type):
+            bounds = pc.min_max(values)
+            low, high = bounds["min"].as_py() or 0, bounds["max"].as_py() or 0
+            if max(abs(low), abs(high)) > 2147483647:  # INT max
+                return (ColumnType.BIGINT, None)
+            return (ColumnType.INTEGER, None)
+
+        if pa_types.is_floating(arrow_type) or pa_types.is_decimal(arrow_type):
+            return (ColumnType.DECIMAL, None)
+        if pa_types.is_boolean(arrow_type):
+            return (ColumnType.BOOLEAN, None)
+        if pa_types.is_date(arrow_type):
+            return (ColumnType.DATE, None)
+        if pa_types.is_timestamp(arrow_type):
+            return (ColumnType.DATETIME, None)
+
+        max_length = pc.max(pc.utf8_length(values.cast("string"))).as_py()
+        return self._text_type(max_length or 0)
+
+    def _schema_cache_key(
+        self, filepath: Path, sample_size: int, has_header: bool
+    ) -> Optional[str]:
+        """Build the schema cache key, or None when caching is disabled."""
+        if self.schema_cache is None:
+            return None
+        engine = "arrow" if self.use_arrow else "python"
+        return SchemaCache.make_key(filepath, sample_size, has_header, engine)
+
+    def _get_cached_schema(self, cache_key: Optional[str]) -> Optional[List[ColumnDefinition]]:
+        """Return cached column definitions for `cache_key`, if any."""
+        if cache_key is None or self.schema_cache is None:
+            return None
+
+        cached = self.schema_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        logger.info("Using cached schema")
+        return [ColumnDefinition(**{**col, "type": ColumnType(col["type"])}) for col in cached]
+
+    def _store_schema(self, cache_key: Optional[str], columns: List[ColumnDefinition]) -> None:
+        """Store inferred column definitions under `cache_key`."""
+        if cache_key is not None and self.schema_cache is not None:
+            self.schema_cache.put(cache_key, [asdict(col) for col in columns])
+
+    def _read_sample(
+        self,
+        reader: Iterator[List[str]],
+        sample_size: int,
+        has_header: bool,
+    ) -> Tuple[List[str], List[List[str]]]:
+        """
+        Read the header and up to `sample_size` data rows from a CSV reader.
+
+        The reader is left positioned right after the sample, so callers can
+        keep streaming the remaining rows from it.
 
-        for col_idx in range(num_cols):
-            col_name = self._sanitize_name(header[col_idx])
-            col_values = [row[col_idx] if col_idx < len(row) else "" for row in samples]
+        Args:
+            reader: CSV reader at the start of the file
+            sample_size: Number of data rows to read
+            has_header: Whether CSV has header row
+
+        Returns:
+            Tuple of (header, sampled rows)
+        """
+        first_row = next(reader, [])
+
+        if has_header:
+            return first_row, list(islice(reader, sample_size))
+
+        # Use column indices as names; the first row is data
+        header = [f"column_{i}" for i in range(len(first_row))]
+        samples = [first_row] if first_row else []
+        samples.extend(islice(reader, max(sample_size - 1, 0)))
+        return header, samples
+
+    def _build_columns(self, header: List[str], samples: List[List[str]]) -> List[ColumnDefinition]:
+        """Infer column definitions from the header and sampled rows."""
+        columns = []
+
+        # Transpose rows to columns in one C-level pass; short rows are padded
+        # with "" (NULL) and columns missing from every row get no values
+        columns_data = list(zip_longest(*samples, fillvalue=""))
+
+        for col_idx, name in enumerate(header):
+            col_name = self._sanitize_name(name)
+            col_values = columns_data[col_idx] if col_idx < len(columns_data) else ()
 
             # Detect type
             col_type, max_length = self._infer_column_type(col_values)
@@ -119,14 +364,14 @@ class CSVToSQL:
                     name=col_name,
                     type=col_type,
                     length=max_length if col_type == ColumnType.VARCHAR else None,
-                    nullable=any(v == "" or v is None for v in col_values),
+                    nullable="" in col_values,
                 )
             )
 
         logger.info(f"Inferred {len(columns)} columns")
         return columns
 
-    def _infer_column_type(self, values: List[str]) -> tuple[ColumnType, Optional[int]]:
+    def _infer_column_type(self, values: Sequence[str]) -> tuple[ColumnType, Optional[int]]:
         """
         Infer column type from sample values.
 
@@ -142,32 +387,38 @@ class CSVToSQL:
         if not non_empty:
             return (ColumnType.VARCHAR, 255)
 
+        # Candidates go from most to least specific. Each check stops at the
+        # first value that doesn't fit, so a rejected type costs only a prefix
+        # of the sample rather than a full pass.
+
         # Try INTEGER
-        if all(self._is_integer(v) for v in non_empty):
+        if all(map(_INTEGER_RE.fullmatch, non_empty)):
             max_val = max(abs(int(v)) for v in non_empty)
             if max_val > 2147483647:  # INT max
                 return (ColumnType.BIGINT, None)
             return (ColumnType.INTEGER, None)
 
-        # Try DECIMAL
-        if all(self._is_decimal(v) for v in non_empty):
+        # Try DECIMAL (integers widen to DECIMAL when mixed with fractions)
+        if all(map(_NUMERIC_RE.fullmatch, non_empty)):
             return (ColumnType.DECIMAL, None)
 
         # Try BOOLEAN
-        if all(v.lower() in ["true", "false", "1", "0", "yes", "no"] for v in non_empty):
+        if _BOOLEAN_VALUES.issuperset(map(str.lower, non_empty)):
             return (ColumnType.BOOLEAN, None)
 
         # Try DATE
-        if all(self._is_date(v) for v in non_empty):
+        if all(map(_DATE_RE.match, non_empty)):
             return (ColumnType.DATE, None)
 
         # Try DATETIME
-        if all(self._is_datetime(v) for v in non_empty):
+        if all(map(_DATETIME_RE.match, non_empty)):
             return (ColumnType.DATETIME, None)
 
         # Default to VARCHAR/TEXT
-        max_length = max(len(v) for v in values)
+        return self._text_type(max(len(v) for v in values))
 
+    def _text_type(self, max_length: int) -> tuple[ColumnType, Optional[int]]:
+        """Pick VARCHAR or TEXT for strings up to `max_length` characters."""
         if max_length > 255:
             return (ColumnType.TEXT, None)
         else:
@@ -175,53 +426,12 @@ class CSVToSQL:
             varchar_length = ((max_length // 50) + 1) * 50
             return (ColumnType.VARCHAR, varchar_length)
 
-    def _is_integer(self, value: str) -> bool:
-        """Check if value is an integer."""
-        try:
-            int(value)
-            return True
-        except ValueError:
-            return False
-
-    def _is_decimal(self, value: str) -> bool:
-        """Check if value is a decimal number."""
-        try:
-            float(value)
-            return "." in value  # Must have decimal point
-        except ValueError:
-            return False
-
-    def _is_date(self, value: str) -> bool:
-        """Check if value is a date."""
-        import re
-
-        # Common date formats: YYYY-MM-DD, DD/MM/YYYY, MM/DD/YYYY
-        patterns = [
-            r"^\d{4}-\d{2}-\d{2}$",
-            r"^\d{2}/\d{2}/\d{4}$",
-            r"^\d{2}-\d{2}-\d{4}$",
-        ]
-        return any(re.match(p, value) for p in patterns)
-
-    def _is_datetime(self, value: str) -> bool:
-        """Check if value is a datetime."""
-        import re
-
-        # ISO format or common datetime formats
-        patterns = [
-            r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
-            r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",
-        ]
-        return any(re.match(p, value) for p in patterns)
-
     def _sanitize_name(self, name: str) -> str:
         """Sanitize column/table name for SQL."""
         # Replace spaces and special chars with underscore
-        import re
-
-        sanitized = re.sub(r"[^\w]", "_", name.lower())
+        sanitized = _NON_WORD_RE.sub("_", name.lower())
         # Remove consecutive underscores
-        sanitized = re.sub(r"_+", "_", sanitized)
+        sanitized = _UNDERSCORES_RE.sub("_", sanitized)
         # Remove leading/trailing underscores
         sanitized = sanitized.strip("_")
         # Ensure doesn't start with number
@@ -325,6 +535,9 @@ class CSVToSQL:
         """
         Generate INSERT statements from CSV.
 
+        Materializes every statement; prefer iter_insert_statements for large
+        files.
+
         Args:
             filepath: Path to CSV file
             table_name: Table name
@@ -335,106 +548,260 @@ class CSVToSQL:
         Returns:
             List of INSERT statements
         """
-        logger.info(f"Generating INSERT statements (batch size: {batch_size})")
+        statements = list(
+            self.iter_insert_statements(filepath, table_name, columns, batch_size, has_header)
+        )
+        logger.info(f"Generated {len(statements)} INSERT statement(s)")
+        return statements
 
-        sanitized_table = self._sanitize_name(table_name)
-        column_names = ", ".join(col.name for col in columns)
+    def iter_insert_statements(
+        self,
+        filepath: Path,
+        table_name: str,
+        columns: List[ColumnDefinition],
+        batch_size: int = 1000,
+        has_header: bool = True,
+    ) -> Iterator[str]:
+        """
+        Lazily generate INSERT statements from CSV, one batch at a time.
+
+        Args:
+            filepath: Path to CSV file
+            table_name: Table name
+            columns: Column definitions
+            batch_size: Number of rows per INSERT
+            has_header: Whether CSV has header
 
-        statements = []
-        current_batch = []
+        Returns:
+            Iterator over INSERT statements
+        """
+        # Not a generator itself, so logging happens at call time rather than
+        # in the middle of streamed output
+        logger.info(f"Generating INSERT statements (batch size: {batch_size})")
 
+        return self._insert_batches(
+            self._read_rows(filepath, has_header), table_name, columns, batch_size
+        )
+
+    def _read_rows(self, filepath: Path, has_header: bool) -> Iterator[List[str]]:
+        """Yield the data rows of a CSV file, keeping it open while iterating."""
         with open(filepath, "r", encoding="utf-8") as f:
             reader = csv.reader(f)
 
             if has_header:
-                next(reader)  # Skip header
-
-            for row in reader:
-                # Format values
-                formatted_values = []
-                for i, value in enumerate(row):
-                    if i >= len(columns):
-                        break
-
-                    col = columns[i]
-
-                    if not value or value.strip() == "":
-                        formatted_values.append("NULL")
-                    elif col.type in [ColumnType.INTEGER, ColumnType.BIGINT, ColumnType.DECIMAL]:
-                        formatted_values.append(value)
-                    elif col.type == ColumnType.BOOLEAN:
-                        bool_val = value.lower() in ["true", "1", "yes"]
-                        if self.dialect == SQLDialect.POSTGRESQL:
-                            formatted_values.append("TRUE" if bool_val else "FALSE")
-                        else:
-                            formatted_values.append("1" if bool_val else "0")
-                    else:
-                        # String types - escape quotes
-                        escaped = value.replace("'", "''")
-                        formatted_values.append(f"'{escaped}'")
-
-                current_batch.append(f"({', '.join(formatted_values)})")
-
-                # Flush batch
-                if len(current_batch) >= batch_size:
-                    stmt = f"INSERT INTO {sanitized_table} ({column_names}) VALUES\n"
-                    stmt += ",\n".join(current_batch) + ";"
-                    statements.append(stmt)
-                    current_batch = []
-
-            # Final batch
-            if current_batch:
-                stmt = f"INSERT INTO {sanitized_table} ({column_names}) VALUES\n"
-                stmt += ",\n".join(current_batch) + ";"
-                statements.append(stmt)
+                next(reader, None)  # Skip header
 
-        logger.info(f"Generated {len(statements)} INSERT statement(s)")
-        return statements
+            yield from reader
 
-    def convert(
+    def _insert_batches(
+        self,
+        rows: Iterable[List[str]],
+        table_name: str,
+        columns: List[ColumnDefinition],
+        batch_size: int,
+    ) -> Iterator[str]:
+        """Yield one INSERT statement per batch of CSV rows."""
+        sanitized_table = self._sanitize_name(table_name)
+        column_names = ", ".join(col.name for col in columns)
+        prefix = f"INSERT INTO {sanitized_table} ({column_names}) VALUES\n"
+
+        # Each batch is written into one StringIO instead of growing strings
+        batch = io.StringIO()
+        batch.write(prefix)
+        batch_rows = 0
+
+        # Pick each column's formatter once instead of dispatching per cell
+        formatters = [self._make_formatter(col) for col in columns]
+
+        for row in rows:
+            formatted_values = [fmt(value) for fmt, value in zip(formatters, row)]
+
+            batch.write(",\n(" if batch_rows else "(")
+            batch.write(", ".join(formatted_values))
+            batch.write(")")
+            batch_rows += 1
+
+            # Flush batch
+            if batch_rows >= batch_size:
+                batch.write(";")
+                yield batch.getvalue()
+                batch.seek(0)
+                batch.truncate()
+                batch.write(prefix)
+                batch_rows = 0
+
+        # Final batch
+        if batch_rows:
+            batch.write(";")
+            yield batch.getvalue()
+
+    def _copy_block(
+        self,
+        rows: Iterable[List[str]],
+        table_name: str,
+        columns: List[ColumnDefinition],
+        batch_size: int,
+    ) -> Iterator[str]:
+        """Yield a PostgreSQL COPY ... FROM STDIN block, `batch_size` rows per chunk."""
+        sanitized_table = self._sanitize_name(table_name)
+        column_names = ", ".join(col.name for col in columns)
+        yield f"COPY {sanitized_table} ({column_names}) FROM STDIN;\n"
+
+        formatters = [
+            _format_copy_boolean if col.type == ColumnType.BOOLEAN else _format_copy_text
+            for col in columns
+        ]
+        num_cols = len(columns)
+
+        rows = iter(rows)
+        while True:
+            lines = []
+            for row in islice(rows, batch_size):
+                if len(row) < num_cols:
+                    row = row + [""] * (num_cols - len(row))  # missing cells are NULL
+                lines.append("\t".join([fmt(value) for fmt, value in zip(formatters, row)]))
+            if not lines:
+                break
+            lines.append("")
+            yield "\n".join(lines)
+
+        yield "\\."
+
+    def _make_formatter(self, col: ColumnDefinition) -> Callable[[str], str]:
+        """Return the function that renders one CSV value of `col` as a SQL literal."""
+        if col.type in (ColumnType.INTEGER, ColumnType.BIGINT, ColumnType.DECIMAL):
+            return _format_numeric
+        if col.type == ColumnType.BOOLEAN:
+            if self.dialect == SQLDialect.POSTGRESQL:
+                return _format_boolean_keyword
+            return _format_boolean_int
+        return _format_string
+
+    def convert_stream(
         self,
         csv_path: Path,
         table_name: str,
-        output_path: Optional[Path] = None,
+        sink: TextIO,
         batch_size: int = 1000,
         schema_only: bool = False,
         primary_key: Optional[str] = None,
-    ) -> str:
+        has_header: bool = True,
+        sample_size: int = 1000,
+        data_format: DataFormat = DataFormat.INSERTS,
+    ) -> int:
         """
-        Convert CSV to SQL.
+        Convert CSV to SQL, writing each statement to `sink` as it is produced.
+
+        The CSV is read in a single pass and memory use is bounded by the
+        inference sample plus one INSERT batch, regardless of file size.
+
+        With `DataFormat.COPY` the rows follow a single COPY ... FROM STDIN
+        command instead, which PostgreSQL loads without parsing each row as
+        SQL (run the script with psql).
 
         Args:
             csv_path: Path to CSV file
             table_name: Table name
-            output_path: Output SQL file path (optional)
+            sink: Writable text stream (open file, sys.stdout, ...)
             batch_size: Rows per INSERT statement
             schema_only: Generate only CREATE TABLE
             primary_key: Primary key column name
+            has_header: Whether CSV has header row
+            sample_size: Number of rows to sample for type inference
+            data_format: Emit INSERT statements or a COPY block
 
         Returns:
-            Generated SQL
+            Number of data statements written (INSERTs, or 1 for a COPY block)
+
+        Raises:
+            ValueError: If COPY output is requested for a dialect other than PostgreSQL
         """
-        # Infer schema
-        columns = self.infer_schema(csv_path)
+        if data_format == DataFormat.COPY and self.dialect != SQLDialect.POSTGRESQL:
+            raise ValueError("COPY output is only supported for PostgreSQL")
 
-        # Generate CREATE TABLE
-        create_stmt = self.generate_create_table(table_name, columns, primary_key)
+        cache_key = self._schema_cache_key(csv_path, sample_size, has_header)
+        columns = self._get_cached_schema(cache_key)
+        if columns is None:
+            logger.info(f"Inferring schema from {csv_path}")
 
-        sql_parts = [create_stmt]
+        with open(csv_path, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
 
-        # Generate INSERTs
-        if not schema_only:
-            insert_stmts = self.generate_insert_statements(
-                csv_path, table_name, columns, batch_size
-            )
-            sql_parts.extend(insert_stmts)
+            # The file is read once: the sample feeds inference and is then
+            # replayed ahead of the remaining rows for the INSERTs
+            header, samples = self._read_sample(reader, sample_size, has_header)
+            if columns is None:
+                if self.use_arrow:
+                    columns = self._infer_schema_arrow(csv_path, sample_size, has_header)
+                else:
+                    columns = self._build_columns(header, samples)
+                self._store_schema(cache_key, columns)
+
+            create_stmt = self.generate_create_table(table_name, columns, primary_key)
+
+            if schema_only:
+                sink.write(create_stmt)
+                sink.write("\n")
+                return 0
+
+            rows = chain(samples, reader)
+
+            if data_format == DataFormat.COPY:
+                logger.info("Generating COPY block")
+                sink.write(create_stmt)
+                sink.write("\n\n")
+                sink.writelines(self._copy_block(rows, table_name, columns, batch_size))
+                sink.write("\n")
+                return 1
+
+            logger.info(f"Generating INSERT statements (batch size: {batch_size})")
+
+            # Generate CREATE TABLE, then INSERTs as they are produced
+            sink.write(create_stmt)
+            count = 0
+            for stmt in self._insert_batches(rows, table_name, columns, batch_size):
+                sink.write("\n\n")
+                sink.write(stmt)
+                count += 1
+            sink.write("\n")
+
+        logger.info(f"Generated {count} INSERT statement(s)")
+        return count
 
-        full_sql = "\n\n".join(sql_parts)
+    def convert(
+        self,
+        csv_path: Path,
+        table_name: str,
+        output_path: Optional[Path] = None,
+        batch_size: int = 1000,
+        schema_only: bool = False,
+        primary_key: Optional[str] = None,
+    ) -> str:
+        """
+        Convert CSV to SQL.
+
+        With `output_path`, statements are streamed straight to the file and
+        the SQL is not kept in memory. Without it, the whole script is built
+        and returned; use convert_stream to write large outputs elsewhere.
 
+        Args:
+            csv_path: Path to CSV file
+            table_name: Table name
+            output_path: Output SQL file path (optional)
+            batch_size: Rows per INSERT statement
+            schema_only: Generate only CREATE TABLE
+            primary_key: Primary key column name
+
+        Returns:
+            Generated SQL, or an empty string when written to `output_path`
+        """
         # Write to file if specified
         if output_path:
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(full_sql)
+                self.convert_stream(csv_path, table_name, f, batch_size, schema_only, primary_key)
             logger.info(f"Wrote SQL to {output_path}")
+            return ""
 
-        return full_sql
+        buffer = io.StringIO()
+        self.convert_stream(csv_path, table_name, buffer, batch_size, schema_only, primary_key)
+        return buffer.getvalue()
@@ -0,0 +1,118 @@
+"""On-disk cache of inferred CSV schemas."""
+
+import os
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from shared.logger import get_logger
+from shared.serialization import dumps, loads
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "api-data-tools"
+    / "schema_memory.sqlite"
+)
+
+
+class SchemaCache:
+    """
+    SQLite-backed cache of inferred schemas.
+
+    Entries are keyed by the file's absolute path, modification time and
+    size plus the inference settings, so an edited file never hits a stale
+    entry. Cache errors are logged and treated as misses.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        """
+        Initialize schema cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+        """
+        self.path = Path(path)
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS schemas (key TEXT PRIMARY KEY, columns_json BLOB)"
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(filepath: Path, sample_size: int, has_header: bool, engine: str = "python") -> str:
+        """
+        Build the cache key for a CSV file.
+
+        Args:
+            filepath: Path to CSV file
+            sample_size: Number of rows sampled for inference
+            has_header: Whether CSV has header row
+            engine: Inference engine that produced the schema
+
+        Returns:
+            Cache key
+        """
+        stat = os.stat(filepath)
+        key = [
+            str(Path(filepath).resolve()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            sample_size,
+            has_header,
+            engine,
+        ]
+        return dumps(key).decode("utf-8")
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached column definitions.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Column definitions as dicts, or None on a miss
+        """
+        try:
+            row = (
+                self._connect()
+                .execute("SELECT columns_json FROM schemas WHERE key = ?", (key,))
+                .fetchone()
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Schema cache lookup failed: {e}")
+            return None
+
+        return loads(row[0]) if row else None
+
+    def put(self, key: str, columns: List[Dict[str, Any]]) -> None:
+        """
+        Store column definitions.
+
+        Args:
+            key: Cache key from make_key
+            columns: Column definitions as dicts
+        """
+        try:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO schemas (key, columns_json) VALUES (?, ?)",
+                (key, dumps(columns)),
+            )
+            conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Schema cache update failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
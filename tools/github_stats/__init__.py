@@ -1,5 +1,6 @@
 """GitHub Stats Fetcher - Analyze GitHub repositories and fetch metrics."""
 
-from .fetcher import GitHubStats, RepoStats
+from .cache import ResponseCache
+from .fetcher import GitHubStats, RateLimitError, RepoStats
 
-__all__ = ["GitHubStats", "RepoStats"]
+__all__ = ["GitHubStats", "RateLimitError", "RepoStats", "ResponseCache"]
@@ -0,0 +1,145 @@
+"""On-disk cache of GitHub API responses with ETag revalidation."""
+
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from shared.logger import get_logger
+from shared.serialization import dumps, loads
+
+logger = get_logger(__name__)
+
+DEFAULT_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "api-data-tools"
+    / "github_responses.sqlite"
+)
+
+# Response headers kept with a cached body
+CACHED_HEADERS = ("etag", "link", "content-type")
+
+
+@dataclass
+class CachedResponse:
+    """A cached API response."""
+
+    body: bytes
+    headers: Dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        """ETag to send as If-None-Match when revalidating."""
+        return self.headers.get("etag")
+
+
+class ResponseCache:
+    """
+    SQLite-backed cache of GitHub GET responses.
+
+    Entries younger than `ttl` are served without a request. Older entries
+    are revalidated with If-None-Match; GitHub answers an unchanged
+    resource with a 304, which doesn't count against the rate limit.
+    Cache errors are logged and treated as misses.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH, ttl: float = 300.0):
+        """
+        Initialize response cache.
+
+        Args:
+            path: SQLite database file (created on first use)
+            ttl: Seconds a response is served without revalidation
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        # Shared by the CLI's fetch threads
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses "
+                "(key TEXT PRIMARY KEY, body BLOB, headers BLOB, stored_at REAL)"
+            )
+        return self._conn
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key (request URL plus credentials fingerprint)
+
+        Returns:
+            CachedResponse, or None on a miss
+        """
+        try:
+            with self._lock:
+                row = (
+                    self._connect()
+                    .execute("SELECT body, headers, stored_at FROM responses WHERE key = ?", (key,))
+                    .fetchone()
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Response cache lookup failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return CachedResponse(body=row[0], headers=loads(row[1]), stored_at=row[2])
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether `entry` can be served without revalidation."""
+        return time.time() - entry.stored_at < self.ttl
+
+    def put(self, key: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Cache key
+            body: Response body
+            headers: Response headers to keep
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, headers, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, body, dumps(headers), time.time()),
+                )
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Response cache update failed: {e}")
+
+    def touch(self, key: str) -> None:
+        """
+        Mark an entry as freshly validated (after a 304).
+
+        Args:
+            key: Cache key
+        """
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key))
+                conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Response cache update failed: {e}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -2,6 +2,8 @@
 
 import json
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import click
@@ -13,10 +15,14 @@ from rich.table import Table
 from shared.cli import create_table, error, handle_errors, info, print_table, success, warning
 from shared.logger import setup_logger
 
+from .cache import ResponseCache
 from .fetcher import GitHubStats, RepoStats
 
 console = Console()
 
+# Upper bound on concurrent GitHub API requests
+MAX_FETCH_WORKERS = 16
+
 
 def display_repo_stats(stats: RepoStats, detailed: bool = False) -> None:
     """
@@ -180,7 +186,7 @@ def display_languages(languages: dict, repo_name: str) -> None:
     table.add_column("Visual", width=30)
 
     # Sort by bytes descending
-    sorted_langs = sorted(languages.items(), key=lambda x: x[1], reverse=True)
+    sorted_langs = Counter(languages).most_common()
 
     for lang, bytes_count in sorted_langs:
         percentage = (bytes_count / total_bytes * 100) if total_bytes > 0 else 0
@@ -218,6 +224,7 @@ def display_languages(languages: dict, repo_name: str) -> None:
     help="Output format",
 )
 @click.option("--token", help="GitHub personal access token (or set GITHUB_TOKEN env var)")
+@click.option("--no-cache", is_flag=True, help="Don't reuse or store API responses")
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @handle_errors
 def main(
@@ -230,6 +237,7 @@ def main(
     limit: int,
     output: str,
     token: Optional[str],
+    no_cache: bool,
     verbose: bool,
 ):
     """
@@ -266,7 +274,9 @@ def main(
     setup_logger(__name__, level=log_level)
 
     # Initialize fetcher
-    fetcher = GitHubStats(token=token)
+    # Responses are cached for 5 minutes and revalidated with ETags after that
+    cache = None if no_cache else ResponseCache()
+    fetcher = GitHubStats(token=token, cache=cache)
 
     # Search mode
     if search:
@@ -277,7 +287,17 @@ def main(
             TextColumn("[progress.description]{task.description}"),
         ) as progress:
             task = progress.add_task("Searching...", total=None)
-            results = fetcher.search_repos(search, sort=sort, limit=limit)
+            include = []
+            if languages:
+                include.append("languages")
+            if contributors:
+                include.append("contributors")
+            if include:
+                results = fetcher.search_repos_enriched(
+                    search, sort=sort, limit=limit, include=include, contributors_limit=limit
+                )
+            else:
+                results = fetcher.search_repos(search, sort=sort, limit=limit)
             progress.update(task, completed=True)
 
         if not results:
@@ -304,17 +324,30 @@ def main(
                 )
 
             print_table(table)
+
+            for r in results:
+                if r.contributors is not None:
+                    display_contributors(r.contributors, r.full_name)
+                if r.languages is not None:
+                    display_languages(r.languages, r.full_name)
         else:
-            data = [
-                {
+            data = []
+            for r in results:
+                item = {
                     "name": r.full_name,
                     "stars": r.stars,
                     "forks": r.forks,
                     "language": r.language,
                     "description": r.description,
                 }
-                for r in results
-            ]
+                if r.languages is not None:
+                    item["languages"] = r.languages
+                if r.contributors is not None:
+                    item["contributors"] = [
+                        {"username": c.username, "contributions": c.contributions}
+                        for c in r.contributors
+                    ]
+                data.append(item)
             print(json.dumps({"results": data, "count": len(data)}, indent=2))
 
         sys.exit(0)
@@ -326,19 +359,36 @@ def main(
 
     repos_list = list(repo)
 
-    # Fetch stats
+    # Contributors and languages are only rendered in rich output
+    fetch_contributors = contributors and output == "rich"
+    fetch_languages = languages and output == "rich"
+    num_requests = len(repos_list) * (1 + fetch_contributors + fetch_languages)
+
+    # Fetch stats, contributors and languages for every repo in one dispatch,
+    # so all API round-trips overlap instead of running loop after loop
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         BarColumn(),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-    ) as progress:
+    ) as progress, ThreadPoolExecutor(
+        max_workers=min(MAX_FETCH_WORKERS, num_requests)
+    ) as executor:
         task = progress.add_task(f"Fetching stats...", total=len(repos_list))
-        
+
+        stats_futures = [executor.submit(fetcher.get_repo_stats, r) for r in repos_list]
+        contrib_futures = [
+            executor.submit(fetcher.get_contributors, r, limit=limit)
+            for r in repos_list
+            if fetch_contributors
+        ]
+        lang_futures = [
+            executor.submit(fetcher.get_languages, r) for r in repos_list if fetch_languages
+        ]
+
         stats_list = []
-        for r in repos_list:
-            stats = fetcher.get_repo_stats(r)
-            stats_list.append(stats)
+        for future in stats_futures:
+            stats_list.append(future.result())
             progress.advance(task)
 
     # Check for errors
@@ -380,17 +430,17 @@ def main(
         for stats in valid_stats:
             display_repo_stats(stats, detailed=True)
 
-    # Additional info
+    # Additional info, for the repositories whose stats were fetched
     if contributors:
-        for r in repos_list:
-            contribs = fetcher.get_contributors(r, limit=limit)
-            if contribs:
+        for r, s, contrib_future in zip(repos_list, stats_list, contrib_futures):
+            contribs = contrib_future.result()
+            if contribs and not s.error:
                 display_contributors(contribs, r)
 
     if languages:
-        for r in repos_list:
-            langs = fetcher.get_languages(r)
-            if langs:
+        for r, s, lang_future in zip(repos_list, stats_list, lang_futures):
+            langs = lang_future.result()
+            if langs and not s.error:
                 display_languages(langs, r)
 
     success("Fetch completed!")
@@ -1,16 +1,99 @@
 """Core GitHub statistics fetching logic."""
 
+import asyncio
+import hashlib
+import importlib.util
+import math
 import os
+import random
+import re
+import time
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 
 import httpx
 
+from shared.compat import parse_iso_datetime
 from shared.logger import get_logger
+from shared.serialization import loads
+
+from .cache import CACHED_HEADERS, CachedResponse, ResponseCache
 
 logger = get_logger(__name__)
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Page number of the rel="last" link in a paginated response's Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# Backoff for rate-limited requests (seconds); longer server-requested
+# waits fail fast instead of stalling the caller
+_RETRY_BASE_DELAY = 1.0
+_RETRY_JITTER = 1.0
+_MAX_RETRY_WAIT = 60.0
+
+# Everything RepoStats needs in one GraphQL round-trip
+_REPO_QUERY = """
+query ($owner: String!, $name: String!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    owner { login }
+    description
+    stargazerCount
+    forkCount
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    primaryLanguage { name }
+    licenseInfo { name }
+    repositoryTopics(first: 20) { nodes { topic { name } } }
+    createdAt
+    updatedAt
+    pushedAt
+    diskUsage
+    isFork
+    isArchived
+    defaultBranchRef { name }
+  }
+}
+"""
+
+
+def _parse_retry_after(value: str, now: float) -> float:
+    """
+    Parse a Retry-After value into seconds from `now`.
+
+    Accepts delay-seconds or an HTTP-date (RFC 9110). Malformed values give
+    0, leaving the wait to the backoff floor.
+    """
+    try:
+        wait = float(value)
+    except ValueError:
+        try:
+            wait = parsedate_to_datetime(value).timestamp() - now
+        except (TypeError, ValueError, IndexError):
+            logger.debug(f"Ignoring malformed Retry-After header: {value!r}")
+            return 0.0
+    return wait if math.isfinite(wait) and wait > 0 else 0.0
+
+
+class RateLimitError(Exception):
+    """Raised when GitHub still rate limits a request after all retries."""
+
+    def __init__(self, url: str, retry_after: float):
+        """
+        Initialize rate limit error.
+
+        Args:
+            url: Rate-limited request URL
+            retry_after: Seconds until GitHub accepts requests again
+        """
+        super().__init__(f"Rate limit exceeded for {url} (retry in {retry_after:.0f}s)")
+        self.retry_after = retry_after
+
 
 @dataclass
 class RepoStats:
@@ -39,12 +122,23 @@ class RepoStats:
     days_since_creation: Optional[int] = None
     days_since_update: Optional[int] = None
     stars_per_day: Optional[float] = None
+
+    # Filled in by search_repos_enriched when requested
+    languages: Optional[Dict[str, int]] = None
+    contributors: Optional[List["ContributorStats"]] = None
     
     error: Optional[str] = None
 
-    def calculate_metrics(self) -> None:
-        """Calculate derived metrics."""
-        now = datetime.utcnow()
+    def calculate_metrics(self, now: Optional[datetime] = None) -> None:
+        """
+        Calculate derived metrics.
+
+        Args:
+            now: Reference time (aware, UTC); defaults to the current time.
+                Pass one value when building many stats at once.
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         
         if self.created_at:
             delta = now - self.created_at
@@ -71,18 +165,39 @@ class GitHubStats:
     """
     Fetch GitHub repository statistics.
 
-    Uses GitHub API v3 (REST).
+    Uses GitHub API v3 (REST), and the v4 GraphQL API for repository stats
+    when a token is available (GraphQL requires authentication).
     """
 
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        use_graphql: bool = True,
+        cache: Optional[ResponseCache] = None,
+        max_retries: int = 5,
+    ):
         """
         Initialize GitHub stats fetcher.
 
         Args:
             token: GitHub personal access token (optional but recommended)
+            use_graphql: Fetch repository stats with one GraphQL query when
+                authenticated
+            cache: Cache and revalidate REST GET responses (disabled if None)
+            max_retries: Retries of a rate-limited request before giving up
         """
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
+        self.use_graphql = use_graphql and bool(self.token)
+        self.cache = cache
+        self.max_retries = max_retries
+
+        # Cached responses are only shared between calls with the same credentials
+        self._credentials_id = (
+            hashlib.sha256(self.token.encode("utf-8")).hexdigest()[:16]
+            if self.token
+            else "anonymous"
+        )
         
         self.headers = {
             "Accept": "application/vnd.github.v3+json",
@@ -95,6 +210,28 @@ class GitHubStats:
         else:
             logger.warning("No GitHub token found. Rate limits: 60 req/hour (vs 5000 with token)")
 
+        # Shared client so connections (and TLS sessions) are reused across
+        # calls; HTTP/2 multiplexes concurrent requests when h2 is installed
+        self._client = httpx.Client(
+            headers=self.headers,
+            timeout=10.0,
+            http2=_HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        self._async_client: Optional[httpx.AsyncClient] = None
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "GitHubStats":
+        """Use the fetcher as a context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Close the HTTP client on exit."""
+        self.close()
+
     def get_repo_stats(self, repo: str) -> RepoStats:
         """
         Get statistics for a repository.
@@ -105,65 +242,367 @@ class GitHubStats:
         Returns:
             RepoStats object
         """
+        if self.use_graphql:
+            return self.get_repo_stats_graphql(repo)
+
         logger.info(f"Fetching stats for {repo}")
 
         try:
-            # Validate format
-            if "/" not in repo:
-                raise ValueError(f"Invalid repo format. Use 'owner/repo', got: {repo}")
+            self._validate_repo(repo)
+            response = self._get(f"{self.base_url}/repos/{repo}")
+            return self._repo_stats_from_response(repo, response)
 
-            owner, repo_name = repo.split("/", 1)
+        except Exception as e:
+            return self._repo_error(repo, e)
 
-            # Fetch repo data
-            url = f"{self.base_url}/repos/{repo}"
-            
-            with httpx.Client(headers=self.headers, timeout=10.0) as client:
-                response = client.get(url)
-                
-                if response.status_code == 404:
-                    return self._create_error_stats(repo, "Repository not found")
-                elif response.status_code == 403:
-                    return self._create_error_stats(repo, "Rate limit exceeded or access forbidden")
-                elif response.status_code != 200:
-                    return self._create_error_stats(repo, f"API error: {response.status_code}")
-
-                data = response.json()
-
-            # Parse response
-            stats = RepoStats(
-                name=data["name"],
-                full_name=data["full_name"],
-                owner=data["owner"]["login"],
-                description=data.get("description"),
-                stars=data["stargazers_count"],
-                forks=data["forks_count"],
-                watchers=data["watchers_count"],
-                open_issues=data["open_issues_count"],
-                language=data.get("language"),
-                created_at=datetime.fromisoformat(data["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(data["updated_at"].replace("Z", "+00:00")),
-                pushed_at=datetime.fromisoformat(data["pushed_at"].replace("Z", "+00:00")),
-                size=data["size"],
-                license=data["license"]["name"] if data.get("license") else None,
-                topics=data.get("topics", []),
-                is_fork=data["fork"],
-                is_archived=data["archived"],
-                default_branch=data["default_branch"],
+    def get_repo_stats_graphql(self, repo: str) -> RepoStats:
+        """
+        Get statistics for a repository with a single GraphQL query.
+
+        Requires a token; get_repo_stats uses this automatically when
+        `use_graphql` is enabled.
+
+        Args:
+            repo: Repository in format "owner/repo"
+
+        Returns:
+            RepoStats object
+        """
+        logger.info(f"Fetching stats for {repo} (GraphQL)")
+
+        try:
+            self._validate_repo(repo)
+            response = self._request(
+                "POST", f"{self.base_url}/graphql", json=self._graphql_payload(repo)
             )
+            return self._repo_stats_from_graphql(repo, response)
 
-            stats.calculate_metrics()
-            return stats
+        except Exception as e:
+            return self._repo_error(repo, e)
+
+    async def aget_repo_stats(self, repo: str) -> RepoStats:
+        """
+        Get statistics for a repository asynchronously.
+
+        The async client is created on first use and must be released with
+        aclose() (compare_repos does this).
+
+        Args:
+            repo: Repository in format "owner/repo"
+
+        Returns:
+            RepoStats object
+        """
+        logger.info(f"Fetching stats for {repo}")
+        self._ensure_async_client()
+
+        try:
+            self._validate_repo(repo)
+
+            if self.use_graphql:
+                response = await self._arequest(
+                    "POST", f"{self.base_url}/graphql", json=self._graphql_payload(repo)
+                )
+                return self._repo_stats_from_graphql(repo, response)
+
+            response = await self._aget(f"{self.base_url}/repos/{repo}")
+            return self._repo_stats_from_response(repo, response)
 
-        except ValueError as e:
-            return self._create_error_stats(repo, str(e))
-        
-        except httpx.RequestError as e:
-            logger.error(f"Network error: {e}")
-            return self._create_error_stats(repo, f"Network error: {e}")
-        
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            return self._create_error_stats(repo, f"Error: {e}")
+            return self._repo_error(repo, e)
+
+    def _ensure_async_client(self) -> httpx.AsyncClient:
+        """Create the async client on first use."""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=10.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was created."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+
+    def _paginate(
+        self,
+        url: str,
+        params: Dict[str, Any],
+        max_items: int,
+        items_key: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield up to `max_items` records of a paginated listing.
+
+        Pages of up to 100 records are requested lazily, following the
+        `rel="next"` link until enough records were produced.
+
+        Args:
+            url: First page URL
+            params: Query parameters for the first page
+            max_items: Maximum number of records to yield
+            items_key: Key holding the records when the page is an object
+                (e.g. "items" for search results)
+
+        Raises:
+            httpx.HTTPStatusError: If a page request fails
+        """
+        remaining = max_items
+        next_url: Optional[str] = url
+        page_params: Optional[Dict[str, Any]] = {**params, "per_page": min(max_items, 100)}
+
+        while next_url and remaining > 0:
+            response = self._get(next_url, params=page_params)
+            if response.status_code == 204:  # empty listing
+                return
+            response.raise_for_status()
+
+            page = loads(response.content)
+            records = page.get(items_key, []) if items_key else page
+            yield from islice(records, remaining)
+            remaining -= len(records)
+
+            # The next link already carries every query parameter
+            next_url = response.links.get("next", {}).get("url")
+            page_params = None
+
+    def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """GET `url` through the response cache, when one is configured."""
+        if self.cache is None:
+            return self._request("GET", url, params=params)
+
+        request_url = httpx.URL(url, params=params)
+        key = self._cache_key(request_url)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return self._cached_response(entry, httpx.Request("GET", request_url))
+
+        response = self._request("GET", request_url, headers=self._revalidation_headers(entry))
+        return self._cache_update(key, entry, response)
+
+    async def _aget(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """Async counterpart of _get, using the async client."""
+        assert self._async_client is not None
+
+        if self.cache is None:
+            return await self._arequest("GET", url, params=params)
+
+        request_url = httpx.URL(url, params=params)
+        key = self._cache_key(request_url)
+        entry = self.cache.get(key)
+        if entry is not None and self.cache.is_fresh(entry):
+            return self._cached_response(entry, httpx.Request("GET", request_url))
+
+        response = await self._arequest(
+            "GET", request_url, headers=self._revalidation_headers(entry)
+        )
+        return self._cache_update(key, entry, response)
+
+    def _request(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying rate-limited responses with backoff."""
+        attempt = 0
+        while True:
+            response = self._client.request(method, url, **kwargs)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            attempt += 1
+            logger.warning(f"Rate limited, retrying in {delay:.1f}s ({attempt}/{self.max_retries})")
+            time.sleep(delay)
+
+    async def _arequest(self, method: str, url: Any, **kwargs: Any) -> httpx.Response:
+        """Async counterpart of _request, using the async client."""
+        assert self._async_client is not None
+
+        attempt = 0
+        while True:
+            response = await self._async_client.request(method, url, **kwargs)
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            attempt += 1
+            logger.warning(f"Rate limited, retrying in {delay:.1f}s ({attempt}/{self.max_retries})")
+            await asyncio.sleep(delay)
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """
+        Seconds to wait before retrying `response`, or None if it isn't rate limited.
+
+        Honors Retry-After and X-RateLimit-Reset, with jittered exponential
+        backoff as the lower bound.
+
+        Raises:
+            RateLimitError: If retries are exhausted or GitHub asks for a
+                longer wait than _MAX_RETRY_WAIT
+        """
+        headers = response.headers
+        exhausted = headers.get("x-ratelimit-remaining") == "0"
+        if not (
+            response.status_code == 429
+            or (response.status_code == 403 and (exhausted or "retry-after" in headers))
+        ):
+            return None
+
+        if "retry-after" in headers:
+            wait = _parse_retry_after(headers["retry-after"], time.time())
+        elif exhausted and "x-ratelimit-reset" in headers:
+            # An epoch timestamp; anything else falls back to the backoff floor
+            reset = headers["x-ratelimit-reset"].strip()
+            wait = max(int(reset) - time.time(), 0.0) if reset.isdigit() else 0.0
+        else:
+            wait = 0.0
+
+        if attempt >= self.max_retries or wait > _MAX_RETRY_WAIT:
+            raise RateLimitError(str(response.request.url), wait)
+
+        backoff = _RETRY_BASE_DELAY * 2**attempt + random.uniform(0, _RETRY_JITTER)
+        return max(wait, min(backoff, _MAX_RETRY_WAIT))
+
+    def _cache_key(self, request_url: httpx.URL) -> str:
+        """Cache key for a GET: the full URL plus a credentials fingerprint."""
+        return f"{self._credentials_id} {request_url}"
+
+    def _revalidation_headers(self, entry: Optional[CachedResponse]) -> Dict[str, str]:
+        """Conditional request headers for a stale cache entry."""
+        if entry is not None and entry.etag:
+            return {"If-None-Match": entry.etag}
+        return {}
+
+    def _cache_update(
+        self, key: str, entry: Optional[CachedResponse], response: httpx.Response
+    ) -> httpx.Response:
+        """Store a fresh response, or serve the cached body on 304 Not Modified."""
+        assert self.cache is not None
+
+        if response.status_code == 304 and entry is not None:
+            logger.debug(f"Not modified: {response.request.url}")
+            self.cache.touch(key)
+            return self._cached_response(entry, response.request)
+
+        if response.status_code == 200:
+            headers = {k: response.headers[k] for k in CACHED_HEADERS if k in response.headers}
+            self.cache.put(key, response.content, headers)
+
+        return response
+
+    def _cached_response(self, entry: CachedResponse, request: httpx.Request) -> httpx.Response:
+        """Rebuild a 200 response from a cache entry."""
+        return httpx.Response(200, content=entry.body, headers=entry.headers, request=request)
+
+    def _validate_repo(self, repo: str) -> None:
+        """Reject repository names not in "owner/repo" format."""
+        if "/" not in repo:
+            raise ValueError(f"Invalid repo format. Use 'owner/repo', got: {repo}")
+
+    def _repo_stats_from_response(self, repo: str, response: httpx.Response) -> RepoStats:
+        """Turn a /repos/{repo} response into RepoStats (or an error result)."""
+        if response.status_code == 404:
+            return self._create_error_stats(repo, "Repository not found")
+        elif response.status_code == 403:
+            return self._create_error_stats(repo, "Rate limit exceeded or access forbidden")
+        elif response.status_code != 200:
+            return self._create_error_stats(repo, f"API error: {response.status_code}")
+
+        return self._parse_repo(loads(response.content))
+
+    def _graphql_payload(self, repo: str) -> Dict[str, Any]:
+        """Build the GraphQL request body for `repo`."""
+        owner, name = repo.split("/", 1)
+        return {"query": _REPO_QUERY, "variables": {"owner": owner, "name": name}}
+
+    def _repo_stats_from_graphql(self, repo: str, response: httpx.Response) -> RepoStats:
+        """Turn a GraphQL repository response into RepoStats (or an error result)."""
+        if response.status_code in (401, 403):
+            return self._create_error_stats(repo, "Rate limit exceeded or access forbidden")
+        elif response.status_code != 200:
+            return self._create_error_stats(repo, f"API error: {response.status_code}")
+
+        payload = loads(response.content)
+        data = (payload.get("data") or {}).get("repository")
+
+        if data is None:
+            errors = payload.get("errors") or []
+            if not errors or errors[0].get("type") == "NOT_FOUND":
+                return self._create_error_stats(repo, "Repository not found")
+            return self._create_error_stats(repo, f"API error: {errors[0].get('message')}")
+
+        return self._parse_graphql_repo(data)
+
+    def _parse_graphql_repo(self, data: Dict[str, Any]) -> RepoStats:
+        """Build RepoStats from a GraphQL repository object."""
+        stats = RepoStats(
+            name=data["name"],
+            full_name=data["nameWithOwner"],
+            owner=data["owner"]["login"],
+            description=data.get("description"),
+            stars=data["stargazerCount"],
+            forks=data["forkCount"],
+            # REST reports stars as watchers_count; keep the two paths identical
+            watchers=data["stargazerCount"],
+            # REST counts open pull requests as open issues
+            open_issues=data["issues"]["totalCount"] + data["pullRequests"]["totalCount"],
+            language=(data.get("primaryLanguage") or {}).get("name"),
+            created_at=parse_iso_datetime(data["createdAt"]),
+            updated_at=parse_iso_datetime(data["updatedAt"]),
+            pushed_at=parse_iso_datetime(data["pushedAt"]),
+            size=data["diskUsage"] or 0,
+            license=(data.get("licenseInfo") or {}).get("name"),
+            topics=[node["topic"]["name"] for node in data["repositoryTopics"]["nodes"]],
+            is_fork=data["isFork"],
+            is_archived=data["isArchived"],
+            default_branch=(data.get("defaultBranchRef") or {}).get("name", ""),
+        )
+
+        stats.calculate_metrics()
+        return stats
+
+    def _parse_repo(self, data: Dict[str, Any], now: Optional[datetime] = None) -> RepoStats:
+        """Build RepoStats from a repository object of the REST API (metrics relative to `now`)."""
+        stats = RepoStats(
+            name=data["name"],
+            full_name=data["full_name"],
+            owner=data["owner"]["login"],
+            description=data.get("description"),
+            stars=data["stargazers_count"],
+            forks=data["forks_count"],
+            watchers=data["watchers_count"],
+            open_issues=data["open_issues_count"],
+            language=data.get("language"),
+            created_at=parse_iso_datetime(data["created_at"]),
+            updated_at=parse_iso_datetime(data["updated_at"]),
+            pushed_at=parse_iso_datetime(data["pushed_at"]),
+            size=data["size"],
+            license=data["license"]["name"] if data.get("license") else None,
+            topics=data.get("topics", []),
+            is_fork=data["fork"],
+            is_archived=data["archived"],
+            default_branch=data["default_branch"],
+        )
+
+        stats.calculate_metrics(now)
+        return stats
+
+    def _repo_error(self, repo: str, exc: Exception) -> RepoStats:
+        """Turn an exception raised while fetching `repo` into an error result."""
+        if isinstance(exc, ValueError):
+            return self._create_error_stats(repo, str(exc))
+
+        if isinstance(exc, RateLimitError):
+            logger.error(str(exc))
+            return self._create_error_stats(repo, "Rate limit exceeded")
+
+        if isinstance(exc, httpx.RequestError):
+            logger.error(f"Network error: {exc}")
+            return self._create_error_stats(repo, f"Network error: {exc}")
+
+        logger.error(f"Unexpected error: {exc}")
+        return self._create_error_stats(repo, f"Error: {exc}")
 
     def get_contributors(self, repo: str, limit: int = 10) -> List[ContributorStats]:
         """
@@ -180,19 +619,9 @@ class GitHubStats:
 
         try:
             url = f"{self.base_url}/repos/{repo}/contributors"
-            params = {"per_page": limit}
-
-            with httpx.Client(headers=self.headers, timeout=10.0) as client:
-                response = client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch contributors: {response.status_code}")
-                    return []
-
-                data = response.json()
 
             contributors = []
-            for contrib in data:
+            for contrib in self._paginate(url, {}, limit):
                 contributors.append(
                     ContributorStats(
                         username=contrib["login"],
@@ -207,6 +636,48 @@ class GitHubStats:
             logger.error(f"Failed to fetch contributors: {e}")
             return []
 
+    def get_contributor_count(self, repo: str, include_anonymous: bool = False) -> int:
+        """
+        Count the contributors of a repository without listing them.
+
+        Requests a single contributor per page and reads the total from the
+        page number of the `rel="last"` link, so the response stays tiny
+        however many contributors there are.
+
+        Args:
+            repo: Repository in format "owner/repo"
+            include_anonymous: Also count contributors without a GitHub account
+
+        Returns:
+            Number of contributors (0 if unavailable)
+        """
+        logger.info(f"Counting contributors for {repo}")
+
+        try:
+            url = f"{self.base_url}/repos/{repo}/contributors"
+            params: Dict[str, Any] = {"per_page": 1}
+            if include_anonymous:
+                params["anon"] = 1
+
+            response = self._get(url, params=params)
+
+            if response.status_code == 204:  # empty repository
+                return 0
+            if response.status_code != 200:
+                logger.error(f"Failed to count contributors: {response.status_code}")
+                return 0
+
+            match = _LAST_PAGE_RE.search(response.headers.get("link", ""))
+            if match:
+                return int(match.group(1))
+
+            # A single page: no Link header
+            return len(loads(response.content))
+
+        except Exception as e:
+            logger.error(f"Failed to count contributors: {e}")
+            return 0
+
     def get_languages(self, repo: str) -> Dict[str, int]:
         """
         Get language breakdown for a repository.
@@ -222,41 +693,48 @@ class GitHubStats:
         try:
             url = f"{self.base_url}/repos/{repo}/languages"
 
-            with httpx.Client(headers=self.headers, timeout=10.0) as client:
-                response = client.get(url)
-                
-                if response.status_code != 200:
-                    logger.error(f"Failed to fetch languages: {response.status_code}")
-                    return {}
+            response = self._get(url)
 
-                return response.json()
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch languages: {response.status_code}")
+                return {}
+
+            return loads(response.content)
 
         except Exception as e:
             logger.error(f"Failed to fetch languages: {e}")
             return {}
 
-    def compare_repos(self, repos: List[str]) -> List[RepoStats]:
+    def compare_repos(self, repos: List[str], concurrency: int = 8) -> List[RepoStats]:
         """
         Compare multiple repositories.
 
+        Repositories are fetched concurrently, so the wall time is close to
+        that of the slowest request rather than the sum of all of them.
+
         Args:
             repos: List of repositories in format "owner/repo"
+            concurrency: Maximum number of in-flight requests
 
         Returns:
-            List of RepoStats
+            List of RepoStats in the same order as `repos`
         """
-        results = []
-        for repo in repos:
-            stats = self.get_repo_stats(repo)
-            results.append(stats)
-        return results
+        return asyncio.run(self._gather_repo_stats(repos, concurrency))
 
-    def search_repos(
-        self, 
-        query: str, 
-        sort: str = "stars", 
-        limit: int = 10
-    ) -> List[RepoStats]:
+    async def _gather_repo_stats(self, repos: List[str], concurrency: int) -> List[RepoStats]:
+        """Fetch repo stats through the async client, capped by a semaphore."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(repo: str) -> RepoStats:
+            async with semaphore:
+                return await self.aget_repo_stats(repo)
+
+        try:
+            return list(await asyncio.gather(*(fetch(repo) for repo in repos)))
+        finally:
+            await self.aclose()
+
+    def search_repos(self, query: str, sort: str = "stars", limit: int = 10) -> List[RepoStats]:
         """
         Search GitHub repositories.
 
@@ -275,41 +753,12 @@ class GitHubStats:
             params = {
                 "q": query,
                 "sort": sort,
-                "per_page": limit,
             }
 
-            with httpx.Client(headers=self.headers, timeout=10.0) as client:
-                response = client.get(url, params=params)
-                
-                if response.status_code != 200:
-                    logger.error(f"Search failed: {response.status_code}")
-                    return []
-
-                data = response.json()
-
+            now = datetime.now(timezone.utc)
             results = []
-            for item in data.get("items", []):
-                stats = RepoStats(
-                    name=item["name"],
-                    full_name=item["full_name"],
-                    owner=item["owner"]["login"],
-                    description=item.get("description"),
-                    stars=item["stargazers_count"],
-                    forks=item["forks_count"],
-                    watchers=item["watchers_count"],
-                    open_issues=item["open_issues_count"],
-                    language=item.get("language"),
-                    created_at=datetime.fromisoformat(item["created_at"].replace("Z", "+00:00")),
-                    updated_at=datetime.fromisoformat(item["updated_at"].replace("Z", "+00:00")),
-                    pushed_at=datetime.fromisoformat(item["pushed_at"].replace("Z", "+00:00")),
-                    size=item["size"],
-                    license=item["license"]["name"] if item.get("license") else None,
-                    topics=item.get("topics", []),
-                    is_fork=item["fork"],
-                    is_archived=item["archived"],
-                    default_branch=item["default_branch"],
-                )
-                stats.calculate_metrics()
+            for item in self._paginate(url, params, limit, items_key="items"):
+                stats = self._parse_repo(item, now)
                 results.append(stats)
 
             return results
@@ -318,12 +767,120 @@ class GitHubStats:
             logger.error(f"Search failed: {e}")
             return []
 
+    def search_repos_enriched(
+        self,
+        query: str,
+        sort: str = "stars",
+        limit: int = 10,
+        include: Sequence[str] = ("languages", "contributors"),
+        contributors_limit: int = 10,
+        concurrency: int = 8,
+    ) -> List[RepoStats]:
+        """
+        Search GitHub repositories and fetch extra data for every result.
+
+        The follow-up requests for all results run concurrently instead of
+        one get_languages/get_contributors round-trip after another.
+
+        Args:
+            query: Search query
+            sort: Sort by (stars, forks, updated)
+            limit: Maximum number of results
+            include: Extra data to fetch: "languages" and/or "contributors"
+            contributors_limit: Top contributors to fetch per repository (max 100)
+            concurrency: Maximum number of in-flight requests
+
+        Returns:
+            List of RepoStats with `languages` / `contributors` filled in
+        """
+        results = self.search_repos(query, sort=sort, limit=limit)
+        if results and include:
+            asyncio.run(self._enrich(results, include, contributors_limit, concurrency))
+        return results
+
+    async def _enrich(
+        self,
+        results: List[RepoStats],
+        include: Sequence[str],
+        contributors_limit: int,
+        concurrency: int,
+    ) -> None:
+        """Attach languages and/or contributors to `results`, capped by a semaphore."""
+        self._ensure_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def languages(stats: RepoStats) -> None:
+            async with semaphore:
+                stats.languages = await self._aget_languages(stats.full_name)
+
+        async def contributors(stats: RepoStats) -> None:
+            async with semaphore:
+                stats.contributors = await self._aget_contributors(
+                    stats.full_name, contributors_limit
+                )
+
+        tasks = []
+        for stats in results:
+            if "languages" in include:
+                tasks.append(languages(stats))
+            if "contributors" in include:
+                tasks.append(contributors(stats))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            await self.aclose()
+
+    async def _aget_languages(self, repo: str) -> Dict[str, int]:
+        """Async counterpart of get_languages."""
+        try:
+            response = await self._aget(f"{self.base_url}/repos/{repo}/languages")
+
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch languages: {response.status_code}")
+                return {}
+
+            return loads(response.content)
+
+        except Exception as e:
+            logger.error(f"Failed to fetch languages: {e}")
+            return {}
+
+    async def _aget_contributors(self, repo: str, limit: int) -> List[ContributorStats]:
+        """Async counterpart of get_contributors, limited to the first page."""
+        try:
+            response = await self._aget(
+                f"{self.base_url}/repos/{repo}/contributors",
+                params={"per_page": min(limit, 100)},
+            )
+
+            if response.status_code == 204:  # empty repository
+                return []
+            if response.status_code != 200:
+                logger.error(f"Failed to fetch contributors: {response.status_code}")
+                return []
+
+            return [
+                ContributorStats(
+                    username=contrib["login"],
+                    contributions=contrib["contributions"],
+                    avatar_url=contrib["avatar_url"],
+                )
+                for contrib in loads(response.content)[:limit]
+            ]
+
+        except Exception as e:
+            logger.error(f"Failed to fetch contributors: {e}")
+            return []
+
     def _create_error_stats(self, repo: str, error: str) -> RepoStats:
         """Create RepoStats for error cases."""
-        owner = repo.split("/")[0] if "/" in repo else "unknown"
-        name = repo.split("/")[1] if "/" in repo else repo
+        # Split like _graphql_payload does: the owner is everything before the first "/"
+        owner, sep, name = repo.partition("/")
+        if not sep:
+            owner, name = "unknown", repo
         
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         
         return RepoStats(
             name=name,
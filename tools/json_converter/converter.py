@@ -1,18 +1,68 @@
 """Core data conversion logic."""
 
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, BinaryIO, Callable, Dict, Optional, Tuple, Union
 
 import jmespath
 import toml
 import yaml
 
 from shared.logger import get_logger
+from shared.serialization import dumps, loads
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:  # pragma: no cover - Python < 3.11
+    import tomli as tomllib
+
+try:
+    from yaml import CSafeDumper as YAMLDumper
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as YAMLDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as YAMLLoader  # type: ignore[assignment]
 
 logger = get_logger(__name__)
 
+# orjson reads integers beyond 64 bits as floats. Every integer of up to 18
+# digits fits, so documents with a run of 19 or more digits are parsed with
+# stdlib json instead; mapping all digits to "0" makes that one substring test.
+_LONG_DIGIT_RUN = "0" * 19
+_LONG_DIGIT_RUN_BYTES = b"0" * 19
+_DIGITS_TO_ZERO = str.maketrans("123456789", "000000000")
+_BYTE_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+
+
+def _load_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON, keeping integers that don't fit in 64 bits exact."""
+    if isinstance(data, str):
+        has_long_number = _LONG_DIGIT_RUN in data.translate(_DIGITS_TO_ZERO)
+    else:
+        has_long_number = _LONG_DIGIT_RUN_BYTES in data.translate(_BYTE_DIGITS_TO_ZERO)
+    return json.loads(data) if has_long_number else loads(data)
+
+
+@lru_cache(maxsize=256)
+def _compile_query(query_str: str) -> Any:
+    """Compile a JMESPath expression, reusing it for repeated queries."""
+    return jmespath.compile(query_str)
+
+
+@lru_cache(maxsize=64)
+def _compile_schema(schema_json: bytes) -> Any:
+    """Check a serialized JSON Schema and build its validator, reusing it for repeated schemas."""
+    import jsonschema
+
+    schema = _load_json(schema_json)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
 
 class ConversionFormat(str, Enum):
     """Supported conversion formats."""
@@ -22,6 +72,68 @@ class ConversionFormat(str, Enum):
     TOML = "toml"
 
 
+def _load_json_file(f: BinaryIO) -> Any:
+    """Parse JSON from a binary file."""
+    return _load_json(f.read())
+
+
+def _load_yaml(data: Union[str, BinaryIO]) -> Any:
+    """Parse YAML from a string or a binary file."""
+    return yaml.load(data, Loader=YAMLLoader)
+
+
+def _dump_json(data: Any, pretty: bool, indent: int) -> str:
+    """Serialize to JSON; orjson only indents by two spaces."""
+    if not pretty:
+        return dumps(data).decode("utf-8")
+    if indent == 2:
+        return dumps(data, indent=True).decode("utf-8")
+    return json.dumps(data, indent=indent, ensure_ascii=False)
+
+
+def _dump_yaml(data: Any, pretty: bool, indent: int) -> str:
+    """Serialize to block-style YAML."""
+    return yaml.dump(
+        data,
+        Dumper=YAMLDumper,
+        default_flow_style=False,
+        allow_unicode=True,
+        indent=indent,
+    )
+
+
+def _dump_toml(data: Any, pretty: bool, indent: int) -> str:
+    """Serialize to TOML (no formatting options)."""
+    return toml.dumps(data)
+
+
+# Per-format dispatch tables
+_SUFFIX_FORMATS = {
+    ".json": ConversionFormat.JSON,
+    ".yaml": ConversionFormat.YAML,
+    ".yml": ConversionFormat.YAML,
+    ".toml": ConversionFormat.TOML,
+}
+
+_PARSERS: Dict[ConversionFormat, Callable[[str], Any]] = {
+    ConversionFormat.JSON: _load_json,
+    ConversionFormat.YAML: _load_yaml,
+    ConversionFormat.TOML: tomllib.loads,
+}
+
+_FILE_PARSERS: Dict[ConversionFormat, Callable[[BinaryIO], Any]] = {
+    ConversionFormat.JSON: _load_json_file,
+    ConversionFormat.YAML: _load_yaml,
+    ConversionFormat.TOML: tomllib.load,
+}
+
+_SERIALIZERS: Dict[ConversionFormat, Callable[[Any, bool, int], str]] = {
+    ConversionFormat.JSON: _dump_json,
+    ConversionFormat.YAML: _dump_yaml,
+    ConversionFormat.TOML: _dump_toml,
+}
+
+
 class DataConverter:
     """
     Convert between JSON, YAML, and TOML formats.
@@ -52,22 +164,22 @@ class DataConverter:
 
         # Auto-detect format from extension
         if format is None:
-            suffix = filepath.suffix.lower()
-            if suffix == ".json":
-                format = ConversionFormat.JSON
-            elif suffix in [".yaml", ".yml"]:
-                format = ConversionFormat.YAML
-            elif suffix == ".toml":
-                format = ConversionFormat.TOML
-            else:
+            format = _SUFFIX_FORMATS.get(filepath.suffix.lower())
+            if format is None:
                 raise ValueError(f"Cannot auto-detect format for: {filepath}")
 
-        logger.info(f"Loading {format.value} from {filepath}")
+        # Lazy %-formatting: this runs once per file in batch_convert
+        logger.debug("Loading %s from %s", format.value, filepath)
 
+        # Parse from the binary file: every backend decodes UTF-8 itself, so no
+        # intermediate str copy of the document is built
         try:
-            with open(filepath, "r") as f:
-                content = f.read()
-                return self.parse(content, format)
+            parser = _FILE_PARSERS.get(format)
+            if parser is None:
+                raise ValueError(f"Unsupported format: {format}")
+
+            with open(filepath, "rb") as f:
+                return parser(f)
 
         except Exception as e:
             logger.error(f"Failed to load file: {e}")
@@ -88,15 +200,12 @@ class DataConverter:
             ValueError: If parsing fails
         """
         try:
-            if format == ConversionFormat.JSON:
-                return json.loads(data)
-            elif format == ConversionFormat.YAML:
-                return yaml.safe_load(data)
-            elif format == ConversionFormat.TOML:
-                return toml.loads(data)
-            else:
+            parser = _PARSERS.get(format)
+            if parser is None:
                 raise ValueError(f"Unsupported format: {format}")
 
+            return parser(data)
+
         except Exception as e:
             logger.error(f"Failed to parse {format.value}: {e}")
             raise ValueError(f"Failed to parse {format.value}: {e}")
@@ -124,21 +233,12 @@ class DataConverter:
             ValueError: If conversion fails
         """
         try:
-            if to_format == ConversionFormat.JSON:
-                if pretty:
-                    return json.dumps(data, indent=indent, ensure_ascii=False)
-                else:
-                    return json.dumps(data, ensure_ascii=False)
-
-            elif to_format == ConversionFormat.YAML:
-                return yaml.dump(data, default_flow_style=False, allow_unicode=True, indent=indent)
-
-            elif to_format == ConversionFormat.TOML:
-                return toml.dumps(data)
-
-            else:
+            serializer = _SERIALIZERS.get(to_format)
+            if serializer is None:
                 raise ValueError(f"Unsupported format: {to_format}")
 
+            return serializer(data, pretty, indent)
+
         except Exception as e:
             logger.error(f"Failed to convert to {to_format.value}: {e}")
             raise ValueError(f"Failed to convert to {to_format.value}: {e}")
@@ -165,13 +265,20 @@ class DataConverter:
         data = self.load_file(input_path, format=from_format)
 
         # Convert
-        output_data = self.convert(data, to_format, pretty=pretty)
+        if to_format == ConversionFormat.JSON:
+            # JSON is serialized straight to bytes
+            try:
+                output_data = dumps(data, indent=pretty)
+            except Exception as e:
+                raise ValueError(f"Failed to convert to {to_format.value}: {e}") from e
+        else:
+            output_data = self.convert(data, to_format, pretty=pretty).encode("utf-8")
 
         # Write output
-        with open(output_path, "w") as f:
+        with open(output_path, "wb") as f:
             f.write(output_data)
 
-        logger.info(f"Converted {input_path} to {output_path}")
+        logger.debug("Converted %s to %s", input_path, output_path)
 
     def query(self, data: Any, query_str: str) -> Any:
         """
@@ -188,8 +295,7 @@ class DataConverter:
             ValueError: If query fails
         """
         try:
-            result = jmespath.search(query_str, data)
-            return result
+            return _compile_query(query_str).search(data)
 
         except Exception as e:
             logger.error(f"Query failed: {e}")
@@ -207,17 +313,19 @@ class DataConverter:
             Tuple of (is_valid, error_message)
         """
         try:
-            import jsonschema
-
-            jsonschema.validate(instance=data, schema=schema)
-            return (True, None)
+            from jsonschema.exceptions import best_match
 
-        except jsonschema.ValidationError as e:
-            return (False, str(e))
+            validator = _compile_schema(dumps(schema))
+            # Same error jsonschema.validate would raise
+            error = best_match(validator.iter_errors(data))
 
         except Exception as e:
             return (False, f"Validation error: {e}")
 
+        if error is not None:
+            return (False, str(error))
+        return (True, None)
+
     def minify_json(self, data: Any) -> str:
         """
         Minify JSON data (remove whitespace).
@@ -228,7 +336,7 @@ class DataConverter:
         Returns:
             Minified JSON string
         """
-        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+        return dumps(data).decode("utf-8")
 
     def pretty_print(self, data: Any, format: ConversionFormat, indent: int = 2) -> str:
         """
@@ -250,15 +358,19 @@ class DataConverter:
         output_dir: Path,
         to_format: ConversionFormat,
         pattern: str = "*",
+        max_workers: Optional[int] = None,
     ) -> int:
         """
         Batch convert files in a directory.
 
+        Files are converted in parallel worker processes.
+
         Args:
             input_dir: Input directory
             output_dir: Output directory
             to_format: Target format
             pattern: Glob pattern for input files
+            max_workers: Worker processes (default: CPU count; 1 converts in-process)
 
         Returns:
             Number of files converted
@@ -268,21 +380,45 @@ class DataConverter:
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        converted_count = 0
+        files = [p for p in input_dir.glob(pattern) if p.is_file()]
+        jobs = [(input_file, output_dir, to_format) for input_file in files]
 
-        # Find all matching files
-        for input_file in input_dir.glob(pattern):
-            if input_file.is_file():
-                try:
-                    # Determine output filename
-                    output_file = output_dir / f"{input_file.stem}.{to_format.value}"
+        # Each file is independent CPU-bound work, so spread it over processes;
+        # a single file isn't worth the pool start-up cost
+        if len(jobs) > 1 and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(_convert_one, jobs, chunksize=8))
+        else:
+            results = [_convert_one(job) for job in jobs]
 
-                    # Convert
-                    self.convert_file(input_file, output_file, to_format)
-                    converted_count += 1
-                    logger.info(f"Converted: {input_file.name} → {output_file.name}")
+        converted_count = 0
+        for name, ok, message in results:
+            if ok:
+                converted_count += 1
+            else:
+                logger.warning(f"Failed to convert {name}: {message}")
 
-                except Exception as e:
-                    logger.warning(f"Failed to convert {input_file.name}: {e}")
+        logger.info(f"Converted {converted_count}/{len(jobs)} files to {to_format.value}")
 
         return converted_count
+
+
+def _convert_one(job: Tuple[Path, Path, ConversionFormat]) -> Tuple[str, bool, str]:
+    """
+    Convert one file for batch_convert (runs in a worker process).
+
+    Args:
+        job: Tuple of (input file, output directory, target format)
+
+    Returns:
+        Tuple of (input file name, success, output file name or error message)
+    """
+    input_file, output_dir, to_format = job
+    output_file = output_dir / f"{input_file.stem}.{to_format.value}"
+
+    try:
+        DataConverter().convert_file(input_file, output_file, to_format)
+    except Exception as e:
+        return (input_file.name, False, str(e))
+
+    return (input_file.name, True, output_file.name)
@@ -1,19 +1,39 @@
 """CLI interface for Webhook Receiver."""
 
-import json
 import sys
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 
 import click
 import uvicorn
-from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Query, Request
+from fastapi.responses import Response
+from rich.syntax import Syntax
+from starlette.routing import Route
 
-from shared.cli import error, info, success
+from shared.cli import console, error, info, success
 from shared.logger import setup_logger
+from shared.serialization import dumps, loads
 
-from .receiver import PARSERS, WebhookReceiver, detect_webhook_type
+from .receiver import PARSERS, HeaderDict, WebhookReceiver, detect_webhook_type
+
+# Compiled event loop and HTTP parser (uvicorn[standard], in the "fast" extra).
+# Chosen explicitly so the server log states what is running.
+SERVER_LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+SERVER_HTTP = "httptools" if find_spec("httptools") else "h11"
+
+# Headers shown in the console, in display order (lowercase, like stored headers)
+DISPLAY_HEADERS = ("content-type", "user-agent", "x-github-event", "stripe-signature")
+
+# Larger request bodies are rejected with 413 instead of being buffered
+MAX_BODY_BYTES = 10 * 1024 * 1024
+
+# Full per-webhook console output; main() disables it when stdout isn't a
+# terminal (unless --verbose), leaving the receiver's one-line log per request.
+# Worker processes started by --workers re-import this module and keep the
+# terminal check.
+SHOW_DETAILS = sys.stdout.isatty()
 
 # Global receiver instance
 receiver = WebhookReceiver()
@@ -26,52 +46,53 @@ app = FastAPI(
 )
 
 
-@app.api_route("/{path:path}", methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
-async def catch_all(request: Request, path: str = ""):
-    """Catch-all route to receive webhooks on any path."""
-    # Extract request data
-    method = request.method
-    headers = dict(request.headers)
-    query_params = dict(request.query_params)
-    source_ip = request.client.host
+async def _read_body(request: Request) -> Optional[bytearray]:
+    """
+    Read the request body, giving up once it exceeds MAX_BODY_BYTES.
 
-    # Parse body
-    content_type = headers.get("content-type", "")
-    if "application/json" in content_type:
-        try:
-            body = await request.json()
-        except:
-            body = await request.body()
-            body = body.decode("utf-8") if body else ""
-    else:
-        body = await request.body()
-        body = body.decode("utf-8") if body else ""
+    Returns:
+        Body bytes, or None if the body is too large
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > MAX_BODY_BYTES:
+        return None
 
-    # Add request to history
-    webhook_request = receiver.add_request(
-        method=method,
-        path=f"/{path}",
-        headers=headers,
-        query_params=query_params,
-        body=body,
-        source_ip=source_ip,
-    )
+    # Chunks accumulate in one bytearray instead of being joined at the end
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > MAX_BODY_BYTES:
+            return None
+    return body
 
-    # Auto-detect webhook type
-    parser_type = detect_webhook_type(headers, body)
-    if parser_type and parser_type in PARSERS:
-        parsed = PARSERS[parser_type](headers, body)
-        webhook_request.parser_type = parser_type
-        webhook_request.parsed_data = parsed
 
-    # Display webhook info
-    display_webhook(webhook_request, parser_type)
+def _json_response(content: Any, status_code: int = 200) -> Response:
+    """JSON response encoded with the orjson-backed serializer (datetimes included)."""
+    return Response(content=dumps(content), status_code=status_code, media_type="application/json")
 
-    # Return success response
-    return JSONResponse(
-        content={"status": "received", "id": webhook_request.id, "timestamp": webhook_request.timestamp.isoformat()},
-        status_code=200,
+
+def _received_response(webhook: Any) -> Response:
+    """
+    Acknowledge a stored webhook.
+
+    The body is assembled from bytes: ids are generated as ``req_NNNNN`` and
+    timestamps are ISO 8601, so neither needs JSON escaping.
+    """
+    content = b"".join(
+        (
+            b'{"status":"received","id":"',
+            webhook.id.encode(),
+            b'","timestamp":"',
+            webhook.timestamp.isoformat().encode(),
+            b'"}',
+        )
     )
+    return Response(content=content, media_type="application/json")
+
+
+def _decode_text(raw_body: Union[bytes, bytearray]) -> str:
+    """Decode a non-JSON request body as text."""
+    return raw_body.decode("utf-8", errors="replace") if raw_body else ""
 
 
 @app.get("/")
@@ -79,14 +100,14 @@ async def root():
     """Root endpoint showing receiver status."""
     history = receiver.get_history(limit=10)
 
-    return JSONResponse(
-        content={
+    return _json_response(
+        {
             "status": "running",
             "total_requests": len(receiver.history),
             "recent_requests": [
                 {
                     "id": req.id,
-                    "timestamp": req.timestamp.isoformat(),
+                    "timestamp": req.timestamp,
                     "method": req.method,
                     "path": req.path,
                 }
@@ -97,18 +118,18 @@ async def root():
 
 
 @app.get("/_history")
-async def get_history(limit: int = 50):
+async def get_history(limit: int = Query(50, ge=0)):
     """Get webhook history."""
     history = receiver.get_history(limit=limit)
 
-    return JSONResponse(
-        content={
+    return _json_response(
+        {
             "total": len(receiver.history),
             "returned": len(history),
             "requests": [
                 {
                     "id": req.id,
-                    "timestamp": req.timestamp.isoformat(),
+                    "timestamp": req.timestamp,
                     "method": req.method,
                     "path": req.path,
                     "source_ip": req.source_ip,
@@ -125,17 +146,73 @@ async def get_history(limit: int = 50):
 async def clear_history():
     """Clear webhook history."""
     count = receiver.clear_history()
-    return JSONResponse(content={"status": "cleared", "count": count})
+    return _json_response({"status": "cleared", "count": count})
 
 
-def display_webhook(webhook: Any, parser_type: Optional[str] = None):
-    """Display webhook information in console."""
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.syntax import Syntax
+async def catch_all(request: Request) -> Response:
+    """Catch-all route to receive webhooks on any path."""
+    # Extract request data
+    method = request.method
+    path = request.path_params["path"]
+    # Lowercased once here; the receiver, detection and parsers reuse this dict
+    headers = HeaderDict(request.headers)
+    # Most webhooks carry no query string; skip copying the empty MultiDict
+    query_params = dict(request.query_params) if request.scope["query_string"] else {}
+    source_ip = request.client.host
 
-    console = Console()
+    # Parse body: read the raw bytes once and decode JSON straight from them
+    content_type = headers.get("content-type", "")
+    raw_body = await _read_body(request)
+    if raw_body is None:
+        return _json_response(
+            {"status": "rejected", "error": "Request body too large"}, status_code=413
+        )
+
+    # Media type comes first; parameters such as "; charset=utf-8" follow it
+    if content_type.startswith("application/json"):
+        try:
+            body = loads(raw_body)
+        except ValueError:
+            body = _decode_text(raw_body)
+    else:
+        body = _decode_text(raw_body)
 
+    # Add request to history
+    webhook_request = receiver.add_request(
+        method=method,
+        path=f"/{path}",
+        headers=headers,
+        query_params=query_params,
+        body=body,
+        source_ip=source_ip,
+    )
+
+    # Auto-detect webhook type
+    parser_type = detect_webhook_type(webhook_request.headers, body)
+    if parser_type and parser_type in PARSERS:
+        parsed = PARSERS[parser_type](webhook_request.headers, body)
+        webhook_request.parser_type = parser_type
+        webhook_request.parsed_data = parsed
+
+    # Display webhook info
+    if SHOW_DETAILS:
+        display_webhook(webhook_request, parser_type)
+
+    # Return success response
+    return _received_response(webhook_request)
+
+
+# A plain Starlette route: the handler only needs the raw request, so FastAPI's
+# parameter validation and dependency solving are skipped. Registered last:
+# routes match in order, so the catch-all must not shadow the status and
+# history endpoints above
+app.router.routes.append(
+    Route("/{path:path}", catch_all, methods=["GET", "POST", "PUT", "PATCH", "DELETE"])
+)
+
+
+def display_webhook(webhook: Any, parser_type: Optional[str] = None):
+    """Display webhook information in console."""
     # Header
     header = f"[bold cyan]{webhook.method}[/bold cyan] {webhook.path}"
     if parser_type:
@@ -151,8 +228,7 @@ def display_webhook(webhook: Any, parser_type: Optional[str] = None):
             console.print(f"  {key}: {value}")
 
     # Headers (important ones)
-    important_headers = ["content-type", "user-agent", "x-github-event", "stripe-signature"]
-    filtered_headers = {k: v for k, v in webhook.headers.items() if k.lower() in important_headers}
+    filtered_headers = {k: webhook.headers[k] for k in DISPLAY_HEADERS if k in webhook.headers}
 
     if filtered_headers:
         console.print("\n[bold yellow]Headers:[/bold yellow]")
@@ -163,7 +239,7 @@ def display_webhook(webhook: Any, parser_type: Optional[str] = None):
     if webhook.body:
         console.print("\n[bold yellow]Body:[/bold yellow]")
         if isinstance(webhook.body, dict):
-            body_str = json.dumps(webhook.body, indent=2)
+            body_str = dumps(webhook.body, indent=True).decode("utf-8")
             syntax = Syntax(body_str, "json", theme="monokai", line_numbers=False)
             console.print(syntax)
         else:
@@ -190,7 +266,7 @@ def display_webhook(webhook: Any, parser_type: Optional[str] = None):
 @click.option(
     "--save",
     type=click.Path(dir_okay=False, path_type=Path),
-    help="Save webhooks to file on exit",
+    help="Save webhooks to file on exit (.jsonl for JSON Lines)",
 )
 @click.option(
     "--load",
@@ -202,6 +278,19 @@ def display_webhook(webhook: Any, parser_type: Optional[str] = None):
     type=click.Choice(list(PARSERS.keys()), case_sensitive=False),
     help="Force specific webhook parser (github, stripe, slack)",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Worker processes (each keeps its own history)",
+)
+@click.option(
+    "--fast",
+    is_flag=True,
+    help="Omit the Server and Date response headers",
+)
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 def main(
     port: int,
@@ -209,6 +298,8 @@ def main(
     save: Optional[Path],
     load: Optional[Path],
     parser: Optional[str],
+    workers: int,
+    fast: bool,
     verbose: bool,
 ):
     """
@@ -235,15 +326,32 @@ def main(
         # Load previous webhooks
         webhook-recv --load webhooks.json
 
+        \b
+        # Minimal responses for high request rates
+        webhook-recv --fast
+
+        \b
+        # Spread incoming webhooks over 4 processes
+        webhook-recv --workers 4 --fast
+
     Endpoints:
         GET  /           - Status and recent requests
         GET  /_history   - Full webhook history
         DELETE /_history - Clear history
         *    /*          - Receive webhooks (any method, any path)
     """
+    global SHOW_DETAILS
+
     # Setup logging
     log_level = "DEBUG" if verbose else "INFO"
     setup_logger(__name__, level=log_level)
+    SHOW_DETAILS = verbose or sys.stdout.isatty()
+
+    # History lives in each worker's memory, so it can't be saved or restored
+    # as a whole
+    if workers > 1 and (save or load):
+        error("--save and --load require a single worker")
+        sys.exit(1)
 
     # Load previous webhooks if requested
     if load:
@@ -256,6 +364,9 @@ def main(
 
     # Display startup info
     info(f"Starting Webhook Receiver on http://{host}:{port}")
+    info(f"Event loop: {SERVER_LOOP}, HTTP parser: {SERVER_HTTP}")
+    if workers > 1:
+        info(f"Workers: {workers} (history endpoints show the answering worker's requests)")
     info("Press CTRL+C to stop")
     info("\nEndpoints:")
     info(f"  GET    http://localhost:{port}/         - Status")
@@ -267,10 +378,18 @@ def main(
     try:
         # Run server
         uvicorn.run(
-            app,
+            # Worker processes import the app themselves
+            "tools.webhook_receiver.cli:app" if workers > 1 else app,
             host=host,
             port=port,
+            workers=workers,
+            loop=SERVER_LOOP,
+            http=SERVER_HTTP,
             log_level="error" if not verbose else "info",
+            # Access lines are only shown in verbose mode; skip building them otherwise
+            access_log=verbose,
+            server_header=not fast,
+            date_header=not fast,
         )
     except KeyboardInterrupt:
         info("\n\nShutting down...")
@@ -1,17 +1,68 @@
 """Core webhook receiving and storage logic."""
 
-import json
-from dataclasses import asdict, dataclass
+import asyncio
+import gc
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from shared.compat import DATACLASS_SLOTS
 from shared.logger import get_logger
+from shared.serialization import dump_records, loads
 
 logger = get_logger(__name__)
 
 
-@dataclass
+class HeaderDict(Dict[str, str]):
+    """
+    Header mapping with case-insensitive lookups.
+
+    Keys are lowercased once on construction, so parsers can do plain hashed
+    lookups instead of rebuilding a lowercased copy on every call.
+    """
+
+    def __init__(self, headers: Union[Mapping[str, str], Iterable[Tuple[str, str]], None] = None):
+        # Accepts (key, value) pairs like dict() does; dataclasses.asdict rebuilds
+        # dict subclasses that way
+        pairs = headers.items() if isinstance(headers, Mapping) else headers or ()
+        super().__init__((k.lower(), v) for k, v in pairs)
+
+    def __getitem__(self, key: str) -> str:
+        return super().__getitem__(key.lower())
+
+    def __setitem__(self, key: str, value: str) -> None:
+        super().__setitem__(key.lower(), value)
+
+    def __contains__(self, key: object) -> bool:
+        return super().__contains__(key.lower() if isinstance(key, str) else key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return super().get(key.lower(), default)
+
+
+def as_header_dict(headers: Dict[str, str]) -> HeaderDict:
+    """Wrap headers in a HeaderDict unless they already are one."""
+    if isinstance(headers, HeaderDict):
+        return headers
+    return HeaderDict(headers)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class WebhookRequest:
     """Represents a received webhook request."""
 
@@ -32,7 +83,7 @@ class WebhookReceiver:
     Manages webhook storage and retrieval.
 
     Attributes:
-        history: List of received webhook requests
+        history: Bounded deque of received webhook requests (oldest first)
         max_history: Maximum number of requests to keep in memory
     """
 
@@ -43,9 +94,10 @@ class WebhookReceiver:
         Args:
             max_history: Maximum number of requests to keep in memory
         """
-        self.history: List[WebhookRequest] = []
+        self.history: Deque[WebhookRequest] = deque(maxlen=max_history)
         self.max_history = max_history
         self._request_counter = 0
+        self._by_id: Dict[str, WebhookRequest] = {}
 
     def add_request(
         self,
@@ -73,39 +125,53 @@ class WebhookReceiver:
         self._request_counter += 1
 
         request = WebhookRequest(
-            id=f"req_{self._request_counter:05d}",
+            # %-formatting is cheaper than an f-string with a format spec here
+            id="req_%05d" % self._request_counter,  # noqa: UP031
             timestamp=datetime.now(),
             method=method,
             path=path,
-            headers=headers,
+            headers=as_header_dict(headers),
             query_params=query_params,
             body=body,
             source_ip=source_ip,
         )
 
-        self.history.append(request)
-
-        # Trim history if needed
-        if len(self.history) > self.max_history:
-            self.history = self.history[-self.max_history :]
+        self._store(request)
 
         logger.info(f"Received {method} {path} from {source_ip}")
         return request
 
+    def _store(self, request: WebhookRequest) -> None:
+        """Append request to history, keeping the id index in sync."""
+        # deque(maxlen=...) evicts the oldest entry on overflow
+        if self.history and len(self.history) == self.history.maxlen:
+            evicted = self.history[0]
+            # Ids may repeat after loading a file; only drop the index entry if
+            # it still points at the request being evicted.
+            if self._by_id.get(evicted.id) is evicted:
+                del self._by_id[evicted.id]
+
+        self.history.append(request)
+        self._by_id[request.id] = request
+
+    def _newest(self, items: List[Any]) -> List[Any]:
+        """Return the items that would survive in history; older ones are skipped."""
+        if self.history.maxlen is None:
+            return items
+        return items[max(len(items) - self.history.maxlen, 0) :]
+
     def get_history(self, limit: Optional[int] = None) -> List[WebhookRequest]:
         """
         Get webhook request history.
 
         Args:
-            limit: Maximum number of requests to return
+            limit: Maximum number of requests to return (None, zero or a
+                negative value returns the whole history)
 
         Returns:
             List of WebhookRequest objects (most recent first)
         """
-        history = list(reversed(self.history))
-        if limit:
-            history = history[:limit]
-        return history
+        return list(islice(reversed(self.history), limit if limit and limit > 0 else None))
 
     def get_request(self, request_id: str) -> Optional[WebhookRequest]:
         """
@@ -117,10 +183,7 @@ class WebhookReceiver:
         Returns:
             WebhookRequest or None if not found
         """
-        for request in self.history:
-            if request.id == request_id:
-                return request
-        return None
+        return self._by_id.get(request_id)
 
     def clear_history(self) -> int:
         """
@@ -131,6 +194,7 @@ class WebhookReceiver:
         """
         count = len(self.history)
         self.history.clear()
+        self._by_id.clear()
         self._request_counter = 0
         logger.info(f"Cleared {count} webhook requests")
         return count
@@ -139,53 +203,184 @@ class WebhookReceiver:
         """
         Save webhook history to JSON file.
 
+        Requests are serialized and written one at a time through a buffered
+        writer, so the export never holds a second full copy of the history.
+        A ``.jsonl`` path writes JSON Lines (one request per line) instead.
+
+        Args:
+            filepath: Path to save file
+        """
+        self._write_records(filepath, self.history)
+
+    async def asave_to_file(self, filepath: Path) -> None:
+        """
+        Save webhook history without blocking the event loop.
+
+        The file is written in a worker thread from a snapshot of the history,
+        so requests received meanwhile don't disturb the export.
+
         Args:
             filepath: Path to save file
         """
-        data = {
-            "exported_at": datetime.now().isoformat(),
-            "total_requests": len(self.history),
-            "requests": [
-                {
-                    **asdict(req),
-                    "timestamp": req.timestamp.isoformat(),
-                }
-                for req in self.history
-            ],
-        }
-
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
-
-        logger.info(f"Saved {len(self.history)} requests to {filepath}")
+        await asyncio.to_thread(self._write_records, filepath, list(self.history))
+
+    def _write_records(self, filepath: Path, requests: Sequence[WebhookRequest]) -> None:
+        """Write `requests` as a history export."""
+        envelope = {"exported_at": datetime.now(), "total_requests": len(requests)}
+        dump_records(filepath, requests, envelope)
+
+        logger.info(f"Saved {len(requests)} requests to {filepath}")
 
     def load_from_file(self, filepath: Path) -> int:
         """
-        Load webhook history from JSON file.
+        Load webhook history from JSON or JSON Lines (``.jsonl``) file.
+
+        Only the newest ``max_history`` records are materialized, since older
+        ones would be evicted immediately.
 
         Args:
             filepath: Path to load file
 
         Returns:
-            Number of requests loaded
+            Number of requests read from the file
         """
-        with open(filepath, "r") as f:
-            data = json.load(f)
+        loaded_count, records = self._read_records(filepath)
+        self._store_records(records)
+
+        logger.info(f"Loaded {loaded_count} requests from {filepath}")
+        return loaded_count
+
+    async def aload_from_file(self, filepath: Path) -> int:
+        """
+        Load webhook history without blocking the event loop.
+
+        The file is read and decoded in a worker thread; the requests are
+        added to history back on the event loop.
 
-        loaded_count = 0
-        for req_data in data.get("requests", []):
-            req_data["timestamp"] = datetime.fromisoformat(req_data["timestamp"])
-            request = WebhookRequest(**req_data)
-            self.history.append(request)
-            loaded_count += 1
+        Args:
+            filepath: Path to load file
+
+        Returns:
+            Number of requests read from the file
+        """
+        loaded_count, records = await asyncio.to_thread(self._read_records, filepath)
+        self._store_records(records)
 
         logger.info(f"Loaded {loaded_count} requests from {filepath}")
         return loaded_count
 
+    def _read_records(self, filepath: Path) -> Tuple[int, List[Dict[str, Any]]]:
+        """Decode a history file into (records in file, newest records to keep)."""
+        with open(filepath, "rb") as f:
+            if Path(filepath).suffix == ".jsonl":
+                lines = [line for line in f if line.strip()]
+                return len(lines), [loads(line) for line in self._newest(lines)]
+
+            requests = loads(f.read()).get("requests", [])
+            return len(requests), self._newest(requests)
+
+    def _store_records(self, records: List[Dict[str, Any]]) -> None:
+        """Add decoded history records as requests."""
+        # Bulk construction allocates many short-lived dicts; pausing the cyclic
+        # GC avoids repeated collections over objects that are all kept alive.
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for req_data in records:
+                req_data["timestamp"] = datetime.fromisoformat(req_data["timestamp"])
+                req_data["headers"] = HeaderDict(req_data.get("headers"))
+                self._store(WebhookRequest(**req_data))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
 
 # Parser utilities for common webhook providers
 
 
+def _get_path(data: Any, path: Tuple[str, ...]) -> Any:
+    """Follow nested dict keys, returning None if any level is missing."""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data
+
+
+def _count(value: Any) -> int:
+    """Length of a list field, treating a missing field as empty."""
+    return len(value) if value else 0
+
+
+FieldSpec = Tuple[str, Tuple[str, ...], Optional[Callable[[Any], Any]]]
+
+
+def _compile_extractor(fields: Tuple[FieldSpec, ...]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build an extractor for a fixed payload shape.
+
+    Args:
+        fields: (result key, key path, optional transform) triples
+
+    Returns:
+        Function mapping a payload to the extracted fields
+    """
+
+    def extract(body: Dict[str, Any]) -> Dict[str, Any]:
+        result = {}
+        for key, path, transform in fields:
+            value = _get_path(body, path)
+            result[key] = transform(value) if transform else value
+        return result
+
+    return extract
+
+
+# Per-event field extractors, built once at import time
+_GITHUB_EXTRACTORS = {
+    "push": _compile_extractor(
+        (
+            ("repository", ("repository", "full_name"), None),
+            ("ref", ("ref",), None),
+            ("commits", ("commits",), _count),
+            ("pusher", ("pusher", "name"), None),
+        )
+    ),
+    "pull_request": _compile_extractor(
+        (
+            ("action", ("action",), None),
+            ("pr_number", ("pull_request", "number"), None),
+            ("pr_title", ("pull_request", "title"), None),
+            ("pr_author", ("pull_request", "user", "login"), None),
+        )
+    ),
+    "issues": _compile_extractor(
+        (
+            ("action", ("action",), None),
+            ("issue_number", ("issue", "number"), None),
+            ("issue_title", ("issue", "title"), None),
+        )
+    ),
+}
+
+# Keyed by the resource part of the Stripe event type
+_STRIPE_EXTRACTORS = {
+    "charge": _compile_extractor(
+        (
+            ("amount", ("data", "object", "amount"), None),
+            ("currency", ("data", "object", "currency"), None),
+            ("status", ("data", "object", "status"), None),
+        )
+    ),
+    "customer": _compile_extractor(
+        (
+            ("customer_id", ("data", "object", "id"), None),
+            ("email", ("data", "object", "email"), None),
+        )
+    ),
+}
+
+
 def parse_github_webhook(headers: Dict[str, str], body: Any) -> Optional[Dict[str, Any]]:
     """
     Parse GitHub webhook payload.
@@ -197,7 +392,7 @@ def parse_github_webhook(headers: Dict[str, str], body: Any) -> Optional[Dict[st
     Returns:
         Parsed data or None
     """
-    event_type = headers.get("x-github-event")
+    event_type = as_header_dict(headers).get("x-github-event")
     if not event_type:
         return None
 
@@ -206,24 +401,9 @@ def parse_github_webhook(headers: Dict[str, str], body: Any) -> Optional[Dict[st
 
     parsed = {"event": event_type}
 
-    if event_type == "push":
-        parsed["repository"] = body.get("repository", {}).get("full_name")
-        parsed["ref"] = body.get("ref")
-        parsed["commits"] = len(body.get("commits", []))
-        parsed["pusher"] = body.get("pusher", {}).get("name")
-
-    elif event_type == "pull_request":
-        pr = body.get("pull_request", {})
-        parsed["action"] = body.get("action")
-        parsed["pr_number"] = pr.get("number")
-        parsed["pr_title"] = pr.get("title")
-        parsed["pr_author"] = pr.get("user", {}).get("login")
-
-    elif event_type == "issues":
-        issue = body.get("issue", {})
-        parsed["action"] = body.get("action")
-        parsed["issue_number"] = issue.get("number")
-        parsed["issue_title"] = issue.get("title")
+    extractor = _GITHUB_EXTRACTORS.get(event_type)
+    if extractor:
+        parsed.update(extractor(body))
 
     return parsed
 
@@ -252,16 +432,10 @@ def parse_stripe_webhook(headers: Dict[str, str], body: Any) -> Optional[Dict[st
         "created": body.get("created"),
     }
 
-    data = body.get("data", {}).get("object", {})
-
-    if "charge" in event_type:
-        parsed["amount"] = data.get("amount")
-        parsed["currency"] = data.get("currency")
-        parsed["status"] = data.get("status")
-
-    elif "customer" in event_type:
-        parsed["customer_id"] = data.get("id")
-        parsed["email"] = data.get("email")
+    # Event types are "<resource>.<action>", e.g. "charge.succeeded"
+    extractor = _STRIPE_EXTRACTORS.get(event_type.partition(".")[0])
+    if extractor:
+        parsed.update(extractor(body))
 
     return parsed
 
@@ -300,6 +474,13 @@ PARSERS = {
     "slack": parse_slack_webhook,
 }
 
+# Detection probes, checked in order. Register a new provider here and in PARSERS.
+_HEADER_PROBES: Tuple[Tuple[str, str], ...] = (
+    ("x-github-event", "github"),
+    ("stripe-signature", "stripe"),
+)
+_BODY_TYPE_PROBES: Tuple[Tuple[str, str], ...] = (("url_verification", "slack"),)
+
 
 def detect_webhook_type(headers: Dict[str, str], body: Any) -> Optional[str]:
     """
@@ -312,13 +493,16 @@ def detect_webhook_type(headers: Dict[str, str], body: Any) -> Optional[str]:
     Returns:
         Provider name or None
     """
-    headers_lower = {k.lower(): v for k, v in headers.items()}
-
-    if "x-github-event" in headers_lower:
-        return "github"
-    elif "stripe-signature" in headers_lower:
-        return "stripe"
-    elif isinstance(body, dict) and body.get("type") == "url_verification":
-        return "slack"
+    headers = as_header_dict(headers)
+
+    for key, provider in _HEADER_PROBES:
+        if key in headers:
+            return provider
+
+    if isinstance(body, dict):
+        body_type = body.get("type")
+        for value, provider in _BODY_TYPE_PROBES:
+            if body_type == value:
+                return provider
 
     return None